@@ -3,16 +3,82 @@ import hashlib
 import requests
 import logging
 import datetime
+import time
+from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional
 from app.core.vault import VaultManager, Credential
 from app.core.password_strength import analyze_password, PasswordStrength
 
 logger = logging.getLogger(__name__)
 
+PWNED_CACHE_TTL = 24 * 60 * 60
+PWNED_CACHE_MAX = 256
+
+# Raw HIBP range responses by SHA-1 prefix, shared by every service instance;
+# cleared on lock so the password-hash prefixes don't outlive the session
+_pwned_ranges: Dict[str, Tuple[float, str]] = {}
+
+def clear_pwned_cache():
+    _pwned_ranges.clear()
+
+def _store_pwned_range(prefix: str, text: str):
+    now = time.monotonic()
+    # Scans run off the GUI thread while a lock may clear the cache, so work
+    # from a snapshot and tolerate keys that are already gone
+    for key, (fetched, _) in list(_pwned_ranges.items()):
+        if now - fetched >= PWNED_CACHE_TTL:
+            _pwned_ranges.pop(key, None)
+    _pwned_ranges.pop(prefix, None)
+    # Insertion order is fetch order, so the first keys are the oldest
+    for key in list(_pwned_ranges)[:max(0, len(_pwned_ranges) - PWNED_CACHE_MAX + 1)]:
+        _pwned_ranges.pop(key, None)
+    _pwned_ranges[prefix] = (now, text)
+
+def _range_count(range_text: str, suffix: str) -> int:
+    # Each line is "SUFFIX:COUNT"; find the one suffix instead of parsing them all
+    needle = suffix + ":"
+    if range_text.startswith(needle):
+        start = len(needle)
+    else:
+        pos = range_text.find("\n" + needle)
+        if pos < 0:
+            return 0
+        start = pos + 1 + len(needle)
+    end = range_text.find("\n", start)
+    return int(range_text[start:end if end >= 0 else len(range_text)])
+
+@dataclass(slots=True)
+class ScanResults:
+    leaked: List[Tuple[Credential, int]] = field(default_factory=list)
+    reused: List[Credential] = field(default_factory=list)
+    weak: List[Credential] = field(default_factory=list)
+    score: int = 0
+    total_count: int = 0
+    avg_age_days: int = 0
+    tfa_count: int = 0
+
 class WatchtowerService:
     def __init__(self, vault_manager: VaultManager):
         self.vault_manager = vault_manager
-        self._cache_pwned = {} 
+        self._session = requests.Session()
+
+    def _get_pwned_range(self, prefix: str) -> Optional[str]:
+        cached = _pwned_ranges.get(prefix)
+        if cached and time.monotonic() - cached[0] < PWNED_CACHE_TTL:
+            return cached[1]
+            
+        try:
+            url = f"https://api.pwnedpasswords.com/range/{prefix}"
+            response = self._session.get(url, timeout=5)
+            if response.status_code != 200:
+                logger.error(f"HIBP API returned status {response.status_code}")
+                return None
+        except Exception as e:
+            logger.error(f"Error checking HIBP: {e}")
+            return None
+            
+        _store_pwned_range(prefix, response.text)
+        return response.text
 
     def check_pwned(self, password: str) -> int:
         if not password:
@@ -21,29 +87,29 @@ class WatchtowerService:
         sha1_password = hashlib.sha1(password.encode('utf-8')).hexdigest().upper()
         prefix, suffix = sha1_password[:5], sha1_password[5:]
         
-        if prefix in self._cache_pwned:
-            response_text = self._cache_pwned[prefix]
-        else:
-            try:
-                url = f"https://api.pwnedpasswords.com/range/{prefix}"
-                response = requests.get(url, timeout=5)
-                if response.status_code != 200:
-                    logger.error(f"HIBP API returned status {response.status_code}")
-                    return 0
-                response_text = response.text
-                self._cache_pwned[prefix] = response_text
-            except Exception as e:
-                logger.error(f"Error checking HIBP: {e}")
-                return 0
+        range_text = self._get_pwned_range(prefix)
+        if range_text is None:
+            return 0
+        return _range_count(range_text, suffix)
 
-        for line in response_text.splitlines():
-            hash_suffix, count = line.split(':')
-            if hash_suffix == suffix:
-                return int(count)
-                
-        return 0
+    def _check_pwned_batch(self, password_map: Dict[str, List[Credential]]) -> Dict[str, int]:
+        # One range request per distinct prefix; passwords whose lookup failed
+        # are left out so their stored leak status is kept
+        by_prefix = {}
+        for pass_hash, creds in password_map.items():
+            sha1_password = hashlib.sha1(creds[0].password.encode('utf-8')).hexdigest().upper()
+            by_prefix.setdefault(sha1_password[:5], []).append((pass_hash, sha1_password[5:]))
+            
+        results = {}
+        for prefix, entries in by_prefix.items():
+            range_text = self._get_pwned_range(prefix)
+            if range_text is None:
+                continue
+            for pass_hash, suffix in entries:
+                results[pass_hash] = _range_count(range_text, suffix)
+        return results
 
-    def scan_vault(self, network_scan: bool = False) -> Dict:
+    def scan_vault(self, network_scan: bool = False) -> ScanResults:
         credentials = self.vault_manager.get_all_credentials()
         
         leaked_items = []
@@ -51,6 +117,8 @@ class WatchtowerService:
         weak_items = []
         
         password_map = {}
+        weak_hashes = {}
+        hashed_credentials = []
         
         total_items = len(credentials)
         password_ages_days = []
@@ -73,44 +141,44 @@ class WatchtowerService:
             if not cred.password:
                 continue
                 
-            analysis = analyze_password(cred.password)
-            if analysis.strength in [PasswordStrength.WEAK, PasswordStrength.FAIR]:
-                weak_items.append(cred)
-                
-            
             pass_hash = hashlib.sha256(cred.password.encode('utf-8')).hexdigest()
+            hashed_credentials.append((cred, pass_hash))
+            
+            # Reused passwords are only analysed once
             if pass_hash not in password_map:
                 password_map[pass_hash] = []
+                analysis = analyze_password(cred.password)
+                weak_hashes[pass_hash] = analysis.strength in [PasswordStrength.WEAK, PasswordStrength.FAIR]
             password_map[pass_hash].append(cred)
             
+            if weak_hashes[pass_hash]:
+                weak_items.append(cred)
+            
         for pass_hash, creds in password_map.items():
             if len(creds) > 1:
                 reused_items.extend(creds)
                 
-        checked_hashes = {}
-        for cred in credentials:
-            if not cred.password:
-                continue
-            
-            if network_scan:
-                pass_hash = hashlib.sha1(cred.password.encode('utf-8')).hexdigest().upper()
-                if pass_hash in checked_hashes:
-                    count = checked_hashes[pass_hash]
-                else:
-                    count = self.check_pwned(cred.password)
-                    checked_hashes[pass_hash] = count
-                
-                if count != cred.leaked_count:
-                    try:
-                        self.vault_manager.update_credential_leak_status(cred.id, count)
-                        cred.leaked_count = count
-                    except Exception as e:
-                        logger.error(f"Failed to persist leak status: {e}")
-            else:
+        checked_hashes = self._check_pwned_batch(password_map) if network_scan else {}
+        changed_counts = {}
+        for cred, pass_hash in hashed_credentials:
+            count = checked_hashes.get(pass_hash)
+            if count is None:
                 count = cred.leaked_count
+            elif count != cred.leaked_count:
+                changed_counts[cred.id] = count
                 
             if count > 0:
                 leaked_items.append((cred, count))
+                
+        # Changed counts are written together so the vault sends one notification
+        if changed_counts:
+            try:
+                self.vault_manager.update_credentials_leak_status(changed_counts)
+                for cred, pass_hash in hashed_credentials:
+                    if cred.id in changed_counts:
+                        cred.leaked_count = changed_counts[cred.id]
+            except Exception as e:
+                logger.error(f"Failed to persist leak status: {e}")
                  
         score = 100
         if total_items > 0:
@@ -128,12 +196,12 @@ class WatchtowerService:
         if password_ages_days:
             avg_age_days = sum(password_ages_days) // len(password_ages_days)
         
-        return {
-            'leaked': leaked_items,
-            'reused': reused_items,
-            'weak': weak_items,
-            'score': max(0, score),
-            'total_count': total_items,
-            '2fa_count': totp_count,
-            'avg_age_days': avg_age_days
-        }
+        return ScanResults(
+            leaked=leaked_items,
+            reused=reused_items,
+            weak=weak_items,
+            score=max(0, score),
+            total_count=total_items,
+            avg_age_days=avg_age_days,
+            tfa_count=totp_count
+        )
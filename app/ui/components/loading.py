@@ -1,5 +1,5 @@
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt, QTimer, QEvent
+from PySide6.QtCore import Qt, QEvent, QVariantAnimation
 from PySide6.QtGui import QPainter, QPen, QColor
 from app.ui.theme import get_theme
 
@@ -7,8 +7,13 @@ class LoadingOverlay(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.angle = 0
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._rotate)
+        # One full turn every 600ms, only running while the overlay is visible
+        self.animation = QVariantAnimation(self)
+        self.animation.setDuration(600)
+        self.animation.setLoopCount(-1)
+        self.animation.setStartValue(0)
+        self.animation.setEndValue(360)
+        self.animation.valueChanged.connect(self._rotate)
         # Block mouse events
         self.setAttribute(Qt.WA_TransparentForMouseEvents, False)
         
@@ -22,18 +27,18 @@ class LoadingOverlay(QWidget):
         return super().eventFilter(obj, event)
         
     def showEvent(self, event):
-        self.timer.start(16)
+        self.animation.start()
         # Ensure we cover parent when shown for the first time or if parent resized while we were hidden (though event filter handles that too)
         if self.parent():
             self.resize(self.parent().size())
         super().showEvent(event)
         
     def hideEvent(self, event):
-        self.timer.stop()
+        self.animation.stop()
         super().hideEvent(event)
 
-    def _rotate(self):
-        self.angle = (self.angle + 10) % 360
+    def _rotate(self, angle):
+        self.angle = angle
         self.update()
 
     def paintEvent(self, event):
@@ -7,7 +7,7 @@ from PySide6.QtGui import QIcon, QPixmap
 
 from app.ui.theme import get_theme
 
-from app.ui.ui_utils import load_svg_icon
+from app.ui.ui_utils import load_svg_qicon
 from app.ui.components.svg_spinner import SvgSpinner
 
 class SidebarButton(QPushButton):
@@ -63,7 +63,7 @@ class SidebarButton(QPushButton):
             pixmap.fill(Qt.transparent)
             self.setIcon(QIcon(pixmap))
         else:
-            self.setIcon(QIcon(load_svg_icon(self.icon_name, 18, icon_color)))
+            self.setIcon(load_svg_qicon(self.icon_name, 18, icon_color))
 
         self.setIconSize(QSize(18, 18))
 
@@ -102,6 +102,16 @@ class SidebarButton(QPushButton):
             {checked_style}
         """)
 
+    def set_label(self, text: str):
+
+        if text == self.label_text:
+
+            return
+
+        self.label_text = text
+
+        self.setText(f"  {text}")
+
     def setChecked(self, checked: bool):
 
         super().setChecked(checked)
@@ -1,5 +1,5 @@
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt, QTimer, QSize
+from PySide6.QtCore import Qt, QTimer, QSize, QRectF
 from PySide6.QtGui import QPainter, QColor
 from PySide6.QtSvg import QSvgRenderer
 
@@ -13,6 +13,7 @@ SVG_DATA = """
 class SvgSpinner(QWidget):
     def __init__(self, size: int = 48, speed: int = 1000, color: str = "#3b82f6", parent=None):
         super().__init__(parent)
+        self._glyph_size = size
         self.setFixedSize(size, size)
         
         # Transparent background for the widget itself
@@ -44,14 +45,15 @@ class SvgSpinner(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Coordinate translation for rotation
+        # Rotate around the widget centre; the glyph keeps its nominal size and
+        # stays centred if a layout gives the widget more room than that
         w, h = self.width(), self.height()
         painter.translate(w / 2, h / 2)
         painter.rotate(self.angle)
-        painter.translate(-w / 2, -h / 2)
         
         # Render SVG
-        self.renderer.render(painter)
+        s = self._glyph_size
+        self.renderer.render(painter, QRectF(-s / 2, -s / 2, s, s))
         painter.end()
 
     def start(self):
@@ -616,6 +616,9 @@ class GoogleDriveDialog(QDialog):
 
         super().showEvent(event)
 
+        # The dialog is reused, so the connection may have changed since it was last shown
+        self._update_state()
+
         self._center_on_parent()
 
     def _center_on_parent(self):
@@ -9,6 +9,8 @@ from PySide6.QtWidgets import (
 
 from PySide6.QtCore import QTimer
 
+from PySide6.QtGui import QPixmapCache
+
 from app.core.auth import AuthManager
 
 from app.core.vault import VaultManager
@@ -19,6 +21,8 @@ from app.ui.theme import get_stylesheet
 
 from app.core.updater import UpdateManager
 
+from app.core.watchtower_service import clear_pwned_cache
+
 from .login_widget import LoginWidget
 
 from .vault_widget import VaultWidget
@@ -135,6 +139,8 @@ class MainWindow(QMainWindow):
 
         if self.vault_widget:
 
+            self.vault_widget.release_vault()
+
             self.stack.removeWidget(self.vault_widget)
 
         # Removed synchronous derive_key to prevent freeze
@@ -150,6 +156,9 @@ class MainWindow(QMainWindow):
 
     def show_login(self):
 
+        # Both manual and auto lock land here; drop the cached password-hash ranges
+        clear_pwned_cache()
+
         self.stack.setCurrentWidget(self.login_widget)
 
     def lock_vault(self):
@@ -168,6 +177,10 @@ def main():
 
     app.setOrganizationDomain("vaultkeeper.com")
 
+    # KiB; favicons and rasterised SVG icons share this cache, and HiDPI
+    # pixmaps are dpr^2 larger, so scale the ceiling with the screen
+    QPixmapCache.setCacheLimit(int(32 * 1024 * app.devicePixelRatio()))
+
     window = MainWindow()
 
     window.show()
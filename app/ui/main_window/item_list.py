@@ -1,16 +1,21 @@
 
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
+import array
+import bisect
 import datetime
+import re
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QFrame, QHBoxLayout, QLineEdit, QPushButton, 
     QListView, QMenu, QStyledItemDelegate, QStyle
 )
 from PySide6.QtCore import (
-    Qt, Signal, QSize, QTimer, QAbstractListModel, QSortFilterProxyModel, 
-    QModelIndex, QRect
+    Qt, Signal, Slot, QSize, QTimer, QAbstractListModel, QSortFilterProxyModel, 
+    QModelIndex, QRect, QObject, QRunnable, QThreadPool
+)
+from PySide6.QtGui import (
+    QIcon, QPainter, QColor, QFont, QFontMetrics, QPen, QPixmap, QPixmapCache, QImage
 )
-from PySide6.QtGui import QIcon, QPainter, QColor, QFont, QPen, QPixmap
 
 from app.core.vault import Credential, SecureNote, CreditCard
 from app.ui.theme import get_theme
@@ -23,21 +28,92 @@ ITEM_TYPE_CREDENTIAL = "credential"
 ITEM_TYPE_NOTE = "note"
 ITEM_TYPE_CARD = "card"
 
+# Compact per-row type codes used by the model's column storage
+_T_CRED, _T_NOTE, _T_CARD = 0, 1, 2
+_TYPE_CODES = {ITEM_TYPE_CREDENTIAL: _T_CRED, ITEM_TYPE_NOTE: _T_NOTE, ITEM_TYPE_CARD: _T_CARD}
+_TYPE_NAMES = (ITEM_TYPE_CREDENTIAL, ITEM_TYPE_NOTE, ITEM_TYPE_CARD)
+
+_NON_DIGIT = re.compile(r'\D')
+_HTML_TAG = re.compile(r'<[^>]+>')
+
+
+def _note_preview(content: str) -> str:
+    # Remove HTML tags for preview
+    clean_content = _HTML_TAG.sub('', content)
+    return clean_content.strip()[:50].split('\n')[0]
+
 # --- DELEGATE ---
 class VaultItemDelegate(QStyledItemDelegate):
+    # Pre-rendered note/card tiles (rounded background + glyph), shared by all
+    # delegates and keyed by (icon_name, bg_color_hex, size, device pixel ratio)
+    _tile_cache: Dict[Tuple[str, str, int, float], QPixmap] = {}
+    # Credential fallback hex -> QColor, shared the same way
+    _fallback_colors: Dict[str, QColor] = {}
+    
+    # List mode stretches rows to the viewport width, so only the height
+    # matters; a wider hint would add a horizontal scrollbar
+    _SIZE_HINT = QSize(0, 64)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        
+        # Fonts and metrics are built once; elision goes through the cached
+        # metrics instead of asking the painter for fresh ones on every row.
+        base_font = parent.font() if parent is not None else QFont()
+        self._title_font = QFont(base_font)
+        self._title_font.setPixelSize(14)
+        self._title_font.setWeight(QFont.Medium)
+        self._title_fm = QFontMetrics(self._title_font)
+        
+        self._sub_font = QFont(base_font)
+        self._sub_font.setPixelSize(12)
+        self._sub_font.setWeight(QFont.Normal)
+        self._sub_fm = QFontMetrics(self._sub_font)
+        
+        self._initial_font = QFont(base_font)
+        self._initial_font.setPixelSize(16)
+        self._initial_font.setBold(True)
+        
+        # (text, width, pixel size) -> elided text; rows repaint with the same
+        # strings and widths constantly while scrolling
+        self._elide_cache: Dict[Tuple[str, int, int], str] = {}
+        
+        self.refresh_theme()
+        
+    def refresh_theme(self):
+        # Theme colours are parsed into QColors once, not per painted row
         self.theme = get_theme()
+        colors = self.theme.colors
+        self._bg_sel = QColor(colors.primary)
+        self._bg_hover = QColor(colors.accent)
+        self._fg_title = QColor(colors.foreground)
+        self._fg_title_sel = QColor(colors.primary_foreground)
+        self._fg_sub = QColor(colors.muted_foreground)
+        self._fg_sub_sel = QColor(255, 255, 255, 200)
+        
+        view = self.parent()
+        if view is not None:
+            view.viewport().update()
         
     def sizeHint(self, option, index):
-        return QSize(option.rect.width(), 64)
+        return self._SIZE_HINT
         
     def paint(self, painter: QPainter, option, index):
         if not index.isValid():
             return
+        
+        # Rows handed to us outside the visible viewport need no work at all
+        view = option.widget
+        if view is not None and not option.rect.intersects(view.viewport().rect()):
+            return
             
-        painter.save()
-        painter.setRenderHint(QPainter.Antialiasing)
+        # Only pen, brush and font are touched below, so restore just those
+        # instead of pushing the whole painter state for every row.
+        old_pen = painter.pen()
+        old_brush = painter.brush()
+        old_font = painter.font()
+        if not painter.testRenderHint(QPainter.Antialiasing):
+            painter.setRenderHint(QPainter.Antialiasing)
         
         # Get data
         item_type = index.data(VaultModel.TypeRole)
@@ -52,9 +128,9 @@ class VaultItemDelegate(QStyledItemDelegate):
         
         bg_color = Qt.transparent
         if is_selected:
-            bg_color = QColor(self.theme.colors.primary)
+            bg_color = self._bg_sel
         elif is_hover:
-            bg_color = QColor(self.theme.colors.accent)
+            bg_color = self._bg_hover
             
         painter.fillRect(rect, bg_color)
         
@@ -74,32 +150,37 @@ class VaultItemDelegate(QStyledItemDelegate):
         
         # Title
         title_rect = QRect(text_left, rect.top() + 12, text_width, 20)
-        title_color = QColor(self.theme.colors.primary_foreground) if is_selected else QColor(self.theme.colors.foreground)
+        title_color = self._fg_title_sel if is_selected else self._fg_title
         
         painter.setPen(title_color)
-        font = painter.font()
-        font.setPixelSize(14)
-        font.setWeight(QFont.Medium)
-        painter.setFont(font)
+        painter.setFont(self._title_font)
         
-        title_metrics = painter.fontMetrics()
-        elided_title = title_metrics.elidedText(title, Qt.ElideRight, text_width)
+        elided_title = self._elide(self._title_fm, title, text_width, 14)
         painter.drawText(title_rect, Qt.AlignLeft | Qt.AlignVCenter, elided_title)
         
         # Subtitle
         subtitle_rect = QRect(text_left, title_rect.bottom() + 2, text_width, 18)
-        subtitle_color = QColor(255, 255, 255, 200) if is_selected else QColor(self.theme.colors.muted_foreground)
+        subtitle_color = self._fg_sub_sel if is_selected else self._fg_sub
         
         painter.setPen(subtitle_color)
-        font.setPixelSize(12)
-        font.setWeight(QFont.Normal)
-        painter.setFont(font)
+        painter.setFont(self._sub_font)
         
-        sub_metrics = painter.fontMetrics()
-        elided_sub = sub_metrics.elidedText(subtitle, Qt.ElideRight, text_width)
+        elided_sub = self._elide(self._sub_fm, subtitle, text_width, 12)
         painter.drawText(subtitle_rect, Qt.AlignLeft | Qt.AlignVCenter, elided_sub)
         
-        painter.restore()
+        painter.setPen(old_pen)
+        painter.setBrush(old_brush)
+        painter.setFont(old_font)
+        
+    def _elide(self, metrics, text, width, pixel_size):
+        key = (text, width, pixel_size)
+        elided = self._elide_cache.get(key)
+        if elided is None:
+            if len(self._elide_cache) > 4096:
+                self._elide_cache.clear()
+            elided = metrics.elidedText(text, Qt.ElideRight, width)
+            self._elide_cache[key] = elided
+        return elided
         
     def _draw_favicon(self, painter, rect, domain, title_fallback, is_selected, index):
         pixmap = index.data(VaultModel.IconRole)
@@ -107,15 +188,16 @@ class VaultItemDelegate(QStyledItemDelegate):
         # Draw background container regardless
         if not pixmap:
             painter.setPen(Qt.NoPen)
-            painter.setBrush(QColor(get_credential_color(domain)))
+            hex_color = get_credential_color(domain)
+            color = self._fallback_colors.get(hex_color)
+            if color is None:
+                color = self._fallback_colors[hex_color] = QColor(hex_color)
+            painter.setBrush(color)
             painter.drawRoundedRect(rect, 8, 8)
             
             initial = domain[0].upper() if domain else (title_fallback[0].upper() if title_fallback else "?")
             painter.setPen(Qt.white)
-            f = painter.font()
-            f.setPixelSize(16)
-            f.setBold(True)
-            painter.setFont(f)
+            painter.setFont(self._initial_font)
             painter.drawText(rect, Qt.AlignCenter, initial)
         else:
             # Draw explicit background if needed?? Usually favicon has its own or we want transparent.
@@ -150,26 +232,44 @@ class VaultItemDelegate(QStyledItemDelegate):
             pass
 
         if pixmap:
-             # Scale if necessary (delegate painting)
-             target_size = QSize(32, 32)
-             scaled = pixmap.scaled(target_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-             x = rect.x() + (rect.width() - target_size.width()) // 2
-             y = rect.y() + (rect.height() - target_size.height()) // 2
-             painter.drawPixmap(x, y, scaled)
+             # The model hands out favicons already scaled to fit 32x32
+             x = rect.x() + (rect.width() - pixmap.width()) // 2
+             y = rect.y() + (rect.height() - pixmap.height()) // 2
+             painter.drawPixmap(x, y, pixmap)
              
     def _draw_generic_icon(self, painter, rect, icon_name, bg_color_hex):
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(bg_color_hex))
-        painter.drawRoundedRect(rect, 8, 8)
-        
-        pixmap = load_svg_icon(icon_name, 28, "#ffffff")
-        icon_x = rect.x() + (rect.width() - 28) // 2
-        icon_y = rect.y() + (rect.height() - 28) // 2
-        painter.drawPixmap(icon_x, icon_y, pixmap)
+        dpr = painter.device().devicePixelRatioF()
+        key = (icon_name, bg_color_hex, rect.width(), dpr)
+        tile = self._tile_cache.get(key)
+        if tile is None:
+            tile = self._render_generic_tile(icon_name, bg_color_hex, rect.width(), dpr)
+            self._tile_cache[key] = tile
+        painter.drawPixmap(rect.topLeft(), tile)
+        
+    @staticmethod
+    def _render_generic_tile(icon_name, bg_color_hex, size, dpr):
+        tile = QPixmap(int(size * dpr), int(size * dpr))
+        tile.setDevicePixelRatio(dpr)
+        tile.fill(Qt.transparent)
+        
+        p = QPainter(tile)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setPen(Qt.NoPen)
+        p.setBrush(QColor(bg_color_hex))
+        p.drawRoundedRect(QRect(0, 0, size, size), 8, 8)
+        
+        glyph = load_svg_icon(icon_name, 28, "#ffffff")
+        offset = (size - 28) // 2
+        p.drawPixmap(offset, offset, glyph)
+        p.end()
+        return tile
 
 
 # --- WRAPPER CLASSES ---
 class VaultItemWrapper:
+    __slots__ = ('item', 'type', 'id', 'title', 'subtitle', 'domain',
+                 'updated_at', 'search_text', 'is_favorite', 'folder_id')
+    
     def __init__(self, item, type_):
         self.item = item
         self.type = type_
@@ -186,12 +286,7 @@ class VaultItemWrapper:
             self.folder_id = item.folder_id
         elif type_ == ITEM_TYPE_NOTE:
             self.title = item.title
-            import re
-            # Remove HTML tags for preview
-            clean_content = re.sub(r'<[^>]+>', '', item.content)
-            # Remove HTML entities like &nbsp; if desired, but basic tag stripping is good start
-            preview = clean_content.strip()[:50].split('\n')[0]
-            self.subtitle = preview
+            self.subtitle = _note_preview(item.content)
             self.domain = ""
             self.updated_at = getattr(item, 'updated_at', 0) or getattr(item, 'created_at', 0)
             self.search_text = f"{item.title} {item.content}".lower()
@@ -206,8 +301,43 @@ class VaultItemWrapper:
             self.search_text = f"{item.title} {item.cardholder_name}".lower()  
             self.is_favorite = item.is_favorite
             self.folder_id = None
-            
-        self.icon_pixmap = None # Cache for favicon
+
+
+_ITEM_TYPES = {Credential: ITEM_TYPE_CREDENTIAL, SecureNote: ITEM_TYPE_NOTE, CreditCard: ITEM_TYPE_CARD}
+
+
+def _wrap(item) -> VaultItemWrapper:
+    return VaultItemWrapper(item, _ITEM_TYPES[type(item)])
+
+
+def _timestamp_key(value) -> int:
+    # 'YYYY-MM-DD HH:MM:SS' -> YYYYMMDDHHMMSS, which sorts the same way as the string
+    if not value:
+        return 0
+    digits = _NON_DIGIT.sub('', str(value))[:14]
+    return int(digits) if digits else 0
+
+# --- FAVICON SCALING ---
+class _FaviconScaleSignals(QObject):
+    scaled = Signal(str, QImage)
+
+
+class _FaviconScaleTask(QRunnable):
+    # Smooth-scales a favicon on the thread pool. QImage (unlike QPixmap) is
+    # safe to use off the UI thread; the result is converted back there.
+    def __init__(self, domain: str, image: QImage, signals: _FaviconScaleSignals):
+        super().__init__()
+        self.domain = domain
+        self.image = image
+        self.signals = signals
+        
+    def run(self):
+        scaled = self.image.scaled(32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        try:
+            self.signals.scaled.emit(self.domain, scaled)
+        except RuntimeError:
+            pass  # model was destroyed while we were scaling
+
 
 # --- MODEL ---
 class VaultModel(QAbstractListModel):
@@ -225,130 +355,408 @@ class VaultModel(QAbstractListModel):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.items: List[VaultItemWrapper] = []
+        self.sort_role = None
+        self.sort_order = Qt.AscendingOrder
+        self._no_favicon = set()  # domains with no bundled icon
+        self._favicon_pending = set()  # domains being smooth-scaled off-thread
+        self._favicon_signals = _FaviconScaleSignals(self)
+        self._favicon_signals.scaled.connect(self._on_favicon_scaled)
+        self.version = 0  # bumped whenever row contents or order change
+        self._reset_columns()
+
+    _COLUMNS = ('_title', '_subtitle', '_domain', '_updated_at', '_is_favorite',
+                '_folder_id', '_search_text', '_type', '_raw')
+
+    def _reset_columns(self):
+        # Rows are stored column-wise (one list/array per field) so the proxy
+        # and delegate index plain sequences instead of per-row objects.
+        self._title: List[str] = []
+        self._subtitle: List[str] = []
+        self._domain: List[str] = []
+        self._updated_at = array.array('q')
+        self._is_favorite = bytearray()
+        self._folder_id: List[Optional[int]] = []
+        self._search_text: List[str] = []
+        self._type = bytearray()
+        self._raw: list = []
+        self._invalidate_search()
+
+    def _invalidate_search(self):
+        # Any change to row contents or order drops the packed search buffer
+        self.version += 1
+        self._search_buf: Optional[bytes] = None
+        self._search_offsets = array.array('I')
+        self._hits_query: Optional[str] = None
+        self._hits = bytearray()
+
+    def _build_search_buf(self):
+        # All rows' search text, NUL-separated, plus each row's start offset
+        encoded = [t.encode('utf-8') for t in self._search_text]
+        offsets = array.array('I')
+        pos = 0
+        for e in encoded:
+            offsets.append(pos)
+            pos += len(e) + 1
+        self._search_buf = b"\x00".join(encoded)
+        self._search_offsets = offsets
+
+    def search_hits(self, query: str) -> bytearray:
+        """Per-row match mask for a lowercased query, cached until the rows change."""
+        if query == self._hits_query:
+            return self._hits
+        if self._search_buf is None:
+            self._build_search_buf()
+        
+        buf = self._search_buf
+        offsets = self._search_offsets
+        n = len(offsets)
+        hits = bytearray(n)
+        needle = query.encode('utf-8')
+        
+        # One C-level find() sweep over the whole buffer; after a hit, skip to
+        # the next row's start since a row only needs to match once.
+        pos = buf.find(needle)
+        while pos != -1:
+            row = bisect.bisect_right(offsets, pos) - 1
+            hits[row] = 1
+            if row + 1 >= n:
+                break
+            pos = buf.find(needle, offsets[row + 1])
+        
+        self._hits_query = query
+        self._hits = hits
+        return hits
+
+    def _append_items(self, credentials, notes, cards):
+        # Project each display column straight from the vault objects, one
+        # field at a time, rather than building a wrapper object per row.
+        # Must produce the same cells as VaultItemWrapper.
+        items = (*credentials, *notes, *cards)
+        n_notes, n_cards = len(notes), len(cards)
+        
+        self._title.extend([c.domain for c in credentials])
+        self._title.extend([i.title for i in notes])
+        self._title.extend([i.title for i in cards])
+        
+        self._subtitle.extend([c.username for c in credentials])
+        self._subtitle.extend([_note_preview(n.content) for n in notes])
+        self._subtitle.extend([f"•••• {c.card_number[-4:] if len(c.card_number) >= 4 else '****'}"
+                               for c in cards])
+        
+        self._domain.extend([c.domain for c in credentials])
+        self._domain.extend([""] * (n_notes + n_cards))
+        
+        self._updated_at.extend([_timestamp_key(i.updated_at or i.created_at) for i in items])
+        self._is_favorite.extend([1 if i.is_favorite else 0 for i in items])
+        
+        self._folder_id.extend([c.folder_id for c in credentials])
+        self._folder_id.extend([None] * (n_notes + n_cards))
+        
+        self._search_text.extend([f"{c.domain} {c.username}".lower() for c in credentials])
+        self._search_text.extend([f"{n.title} {n.content}".lower() for n in notes])
+        self._search_text.extend([f"{c.title} {c.cardholder_name}".lower() for c in cards])
+        
+        self._type.extend(bytes([_T_CRED]) * len(credentials))
+        self._type.extend(bytes([_T_NOTE]) * n_notes)
+        self._type.extend(bytes([_T_CARD]) * n_cards)
+        
+        self._raw.extend(items)
+        self._invalidate_search()
+
+    @staticmethod
+    def _row_values(w):
+        # One row's cells, in _COLUMNS order
+        return (w.title, w.subtitle, w.domain, _timestamp_key(w.updated_at),
+                1 if w.is_favorite else 0, w.folder_id, w.search_text,
+                _TYPE_CODES[w.type], w.item)
+
+    def _insert_row(self, row, values):
+        for name, value in zip(self._COLUMNS, values):
+            getattr(self, name).insert(row, value)
+
+    def _pop_row(self, row):
+        for name in self._COLUMNS:
+            getattr(self, name).pop(row)
+
+    def _order_key(self, title, subtitle, updated_at, type_code):
+        if self.sort_role == self.SortDateRole:
+            return updated_at
+        if self.sort_role is not None:
+            return title.lower()
+        # Unsorted rows keep the vault's order: logins, notes, cards by title
+        return (type_code, title, subtitle)
+
+    def _insert_position(self, values) -> int:
+        # Row at which a new row belongs under the current ordering
+        key = self._order_key(values[0], values[1], values[3], values[7])
+        descending = self.sort_role is not None and self.sort_order == Qt.DescendingOrder
+        for row in range(len(self._raw)):
+            k = self._order_key(self._title[row], self._subtitle[row],
+                                self._updated_at[row], self._type[row])
+            if (k < key) if descending else (k > key):
+                return row
+        return len(self._raw)
+
+    def find_row(self, type_, item_id) -> int:
+        # Ids are only unique per table, so match on type as well
+        code = _TYPE_CODES[type_]
+        types = self._type
+        for row, item in enumerate(self._raw):
+            if item.id == item_id and types[row] == code:
+                return row
+        return -1
+
+    def _apply_sort(self):
+        # One Timsort pass over a key column, then every column is reordered
+        # by the resulting permutation.
+        if self.sort_role is None or not self._raw:
+            return
+        if self.sort_role == self.SortDateRole:
+            keys = self._updated_at
+        else:
+            keys = [t.lower() for t in self._title]
+        perm = sorted(range(len(keys)), key=keys.__getitem__,
+                      reverse=(self.sort_order == Qt.DescendingOrder))
+        
+        self._title = [self._title[i] for i in perm]
+        self._subtitle = [self._subtitle[i] for i in perm]
+        self._domain = [self._domain[i] for i in perm]
+        self._updated_at = array.array('q', [self._updated_at[i] for i in perm])
+        self._is_favorite = bytearray([self._is_favorite[i] for i in perm])
+        self._folder_id = [self._folder_id[i] for i in perm]
+        self._search_text = [self._search_text[i] for i in perm]
+        self._type = bytearray([self._type[i] for i in perm])
+        self._raw = [self._raw[i] for i in perm]
+        self._invalidate_search()
+
+    def sort_by(self, role, order=Qt.AscendingOrder):
+        self.sort_role = role
+        self.sort_order = order
+        self.beginResetModel()
+        self._apply_sort()
+        self.endResetModel()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sort_by(self.sort_role or self.TitleRole, order)
         
     def rowCount(self, parent=QModelIndex()):
-        return len(self.items)
+        return len(self._raw)
         
     def data(self, index, role=Qt.DisplayRole):
-        if not index.isValid() or index.row() >= len(self.items):
+        row = index.row()
+        if not index.isValid() or row >= len(self._raw):
             return None
-            
-        item = self.items[index.row()]
         
         if role == self.TypeRole:
-            return item.type
+            return _TYPE_NAMES[self._type[row]]
         elif role == self.TitleRole:
-            return item.title
+            return self._title[row]
         elif role == self.SubtitleRole:
-            return item.subtitle
+            return self._subtitle[row]
         elif role == self.DomainRole:
-            return item.domain
+            return self._domain[row]
         elif role == self.ItemRole:
-            return item.item
+            return self._raw[row]
         elif role == self.SortDateRole:
-            return item.updated_at
+            return self._updated_at[row]
         elif role == self.IsFavoriteRole:
-            return item.is_favorite
+            return bool(self._is_favorite[row])
         elif role == self.FolderIdRole:
-            return item.folder_id
+            return self._folder_id[row]
         elif role == self.SearchRole:
-            return item.search_text
+            return self._search_text[row]
             
         elif role == self.IconRole:
-            # Handle Icon Loading (Sync)
-            if item.type == ITEM_TYPE_CREDENTIAL:
-                if item.icon_pixmap is None:
-                     # Try to get from cache/disk safely
-                     pix = get_favicon(item.domain)
-                     if pix:
-                         item.icon_pixmap = pix
-                         return pix
-                     # If return None, it stays None, drawing default fallback
-                     return None
-                else:
-                    return item.icon_pixmap
+            if self._type[row] == _T_CRED:
+                domain = self._domain[row]
+                if not domain or domain in self._no_favicon:
+                    return None
+                # Favicons live in the global QPixmapCache, pre-scaled for the
+                # delegate, so they survive model resets and are LRU-bounded
+                key = f"fav:{domain}"
+                pix = QPixmapCache.find(key)
+                if pix is None:
+                    raw = get_favicon(domain)
+                    if not raw:
+                        # None draws the default fallback; remember the miss
+                        self._no_favicon.add(domain)
+                        return None
+                    # Paint a cheap nearest-neighbour version now; the smooth
+                    # one replaces it once the thread pool has produced it
+                    pix = raw.scaled(32, 32, Qt.KeepAspectRatio, Qt.FastTransformation)
+                    QPixmapCache.insert(key, pix)
+                    if domain not in self._favicon_pending:
+                        self._favicon_pending.add(domain)
+                        QThreadPool.globalInstance().start(
+                            _FaviconScaleTask(domain, raw.toImage(), self._favicon_signals))
+                return pix
             return None
             
         return None
 
+    @Slot(str, QImage)
+    def _on_favicon_scaled(self, domain, image):
+        self._favicon_pending.discard(domain)
+        QPixmapCache.insert(f"fav:{domain}", QPixmap.fromImage(image))
+        for row, d in enumerate(self._domain):
+            if d == domain:
+                idx = self.index(row)
+                self.dataChanged.emit(idx, idx, [self.IconRole])
+
     def update_data(self, credentials, notes, cards):
         self.beginResetModel()
-        self.items = []
-        
-        # Helper to safely create items
-        for c in credentials:
-            self.items.append(VaultItemWrapper(c, ITEM_TYPE_CREDENTIAL))
-        for n in notes:
-            self.items.append(VaultItemWrapper(n, ITEM_TYPE_NOTE))
-        for c in cards:
-            self.items.append(VaultItemWrapper(c, ITEM_TYPE_CARD))
+        self._reset_columns()
+        self._append_items(credentials, notes, cards)
+        self._apply_sort()
             
         self.endResetModel()
 
     def clear(self):
         self.beginResetModel()
-        self.items = []
+        self._reset_columns()
         self.endResetModel()
 
-    def add_items(self, wrappers):
-        if not wrappers:
+    def add_items(self, credentials, notes, cards):
+        count = len(credentials) + len(notes) + len(cards)
+        if not count:
+            return
+        if self.sort_role is not None:
+            # Appending would break the active ordering, so re-sort in one reset
+            self.beginResetModel()
+            self._append_items(credentials, notes, cards)
+            self._apply_sort()
+            self.endResetModel()
             return
-        start = len(self.items)
-        self.beginInsertRows(QModelIndex(), start, start + len(wrappers) - 1)
-        self.items.extend(wrappers)
+        start = len(self._raw)
+        self.beginInsertRows(QModelIndex(), start, start + count - 1)
+        self._append_items(credentials, notes, cards)
+        self.endInsertRows()
+
+    def add_item(self, wrapper):
+        values = self._row_values(wrapper)
+        row = self._insert_position(values)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._insert_row(row, values)
+        self._invalidate_search()
         self.endInsertRows()
 
+    def update_item(self, wrapper) -> bool:
+        row = self.find_row(wrapper.type, wrapper.id)
+        if row < 0:
+            return False
+        values = self._row_values(wrapper)
+        
+        # Work out where the edited row now sorts among the others
+        old = tuple(getattr(self, name)[row] for name in self._COLUMNS)
+        self._pop_row(row)
+        dest = self._insert_position(values)
+        self._insert_row(row, old)
+        
+        if dest != row:
+            # Qt counts the destination before the row is taken out
+            self.beginMoveRows(QModelIndex(), row, row, QModelIndex(),
+                               dest if dest < row else dest + 1)
+            self._pop_row(row)
+            self._insert_row(dest, values)
+            self._invalidate_search()
+            self.endMoveRows()
+        else:
+            self._pop_row(row)
+            self._insert_row(row, values)
+            self._invalidate_search()
+        idx = self.index(dest)
+        self.dataChanged.emit(idx, idx)
+        return True
+
+    def remove_item(self, type_, item_id) -> bool:
+        row = self.find_row(type_, item_id)
+        if row < 0:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._pop_row(row)
+        self._invalidate_search()
+        self.endRemoveRows()
+        return True
+
 # --- PROXY MODEL ---
+def _and_masks(a, b, n: int) -> bytes:
+    # Element-wise AND of two 0/1 byte masks via one big-int operation
+    return (int.from_bytes(a, 'little') & int.from_bytes(b, 'little')).to_bytes(n, 'little')
+
+
+
 class VaultSortFilterProxyModel(QSortFilterProxyModel):
+    # Category -> the single item type code it shows ("all" means all logins)
+    _CATEGORY_TYPES = {
+        "all": _T_CRED,
+        "folder": _T_CRED,
+        "secure_notes": _T_NOTE,
+        "credit_cards": _T_CARD,
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.filter_category = "all"
         self.filter_folder_id = None
         self.search_query = ""
+        self._src = None
+        self._required_type = _T_CRED
+        self._favorites_only = False
+        self._folder_only = False
+        self._accept = bytearray()
+        self._accept_version = -1
         self.setDynamicSortFilter(True)
         self.setSortCaseSensitivity(Qt.CaseInsensitive)
         
+    def setSourceModel(self, model):
+        self._src = model
+        self._accept_version = -1
+        super().setSourceModel(model)
+        
     def set_category_filter(self, category: str, folder_id: Optional[int] = None):
         self.filter_category = category
         self.filter_folder_id = folder_id
+        # Resolve the category once so filterAcceptsRow is just integer compares
+        self._required_type = self._CATEGORY_TYPES.get(category)
+        self._favorites_only = category == "favorites"
+        self._folder_only = category == "folder"
+        self._accept_version = -1
         self.invalidateFilter()
         
     def set_search_query(self, query: str):
         self.search_query = query.lower()
+        self._accept_version = -1
         self.invalidateFilter()
         
-    def filterAcceptsRow(self, source_row, source_parent):
-        # 1. Category Filter
-        idx = self.sourceModel().index(source_row, 0, source_parent)
-        
-        item_type = idx.data(VaultModel.TypeRole)
-        is_fav = idx.data(VaultModel.IsFavoriteRole)
-        folder_id = idx.data(VaultModel.FolderIdRole)
-        
-        if self.filter_category == "favorites" and not is_fav:
-            return False
-        if self.filter_category == "secure_notes" and item_type != ITEM_TYPE_NOTE:
-            return False
-        if self.filter_category == "credit_cards" and item_type != ITEM_TYPE_CARD:
-            return False
-        if self.filter_category == "folder":
-             if item_type != ITEM_TYPE_CREDENTIAL or folder_id != self.filter_folder_id:
-                 return False
-        if self.filter_category == "all":
-            pass # Show all credentials? Original logic hid non-credentials in "all"? 
-            # Re-checking logic: "if self.current_category == "all": if item_type != "credential": visible = False"
-            # So "All Categories" actually meant "All Logins". 
-            if item_type != ITEM_TYPE_CREDENTIAL:
-                 return False
-                 
-        # 2. Search Filter
+    def _build_accept(self):
+        # Per-row accept mask for the current category + search, built in
+        # bulk from the source columns instead of one row at a time
+        src = self._src
+        n = len(src._raw)
+        
+        if self._required_type is not None:
+            table = bytearray(256)
+            table[self._required_type] = 1
+            mask = src._type.translate(table)
+        elif self._favorites_only:
+            mask = bytes(src._is_favorite)
+        else:
+            mask = b"\x01" * n
+            
+        if self._folder_only:
+            fid = self.filter_folder_id
+            folder_mask = bytes([f == fid for f in src._folder_id])
+            mask = _and_masks(mask, folder_mask, n)
         if self.search_query:
-            search_text = idx.data(VaultModel.SearchRole)
-            if self.search_query not in search_text:
-                return False
-                
-        return True
+            mask = _and_masks(mask, src.search_hits(self.search_query), n)
+            
+        self._accept = mask
+        self._accept_version = src.version
+        
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._accept_version != self._src.version:
+            self._build_accept()
+        return bool(self._accept[source_row])
 
     def lessThan(self, left, right):
         # Handle sorting by date or string
@@ -411,6 +819,11 @@ class CredentialsList(QWidget):
                 border-color: {theme.colors.ring};
             }}
         """)
+        self._pending_query = ""
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(100)
+        self._search_timer.timeout.connect(self._apply_search)
         self.search_input.textChanged.connect(self.on_search_changed)
         search_layout.addWidget(self.search_input)
         header_layout.addLayout(search_layout)
@@ -486,7 +899,23 @@ class CredentialsList(QWidget):
         super().resizeEvent(event)
         
     def set_all_items(self, credentials, notes, cards):
-        self.model.update_data(credentials, notes, cards)
+        # Keep the proxy from re-sorting/re-filtering while the model changes,
+        # then run a single filter pass at the end. The view is frozen and its
+        # selection signals muted so the reset repaints once and does not
+        # bounce a current-item change through on_selection_changed.
+        view = self.list_view
+        selection = view.selectionModel()
+        view.setUpdatesEnabled(False)
+        was_blocked = selection.blockSignals(True)
+        was_dynamic = self.proxy_model.dynamicSortFilter()
+        self.proxy_model.setDynamicSortFilter(False)
+        try:
+            self.model.update_data(credentials, notes, cards)
+        finally:
+            self.proxy_model.setDynamicSortFilter(was_dynamic)
+            self.proxy_model.invalidate()
+            selection.blockSignals(was_blocked)
+            view.setUpdatesEnabled(True)
         # Select first item if nothing selected?
         if self.proxy_model.rowCount() > 0:
             # self.list_view.setCurrentIndex(self.proxy_model.index(0, 0))
@@ -496,11 +925,33 @@ class CredentialsList(QWidget):
         self.model.clear()
 
     def add_items_batch(self, credentials, notes, cards):
-        wrappers = []
-        for c in credentials: wrappers.append(VaultItemWrapper(c, ITEM_TYPE_CREDENTIAL))
-        for n in notes: wrappers.append(VaultItemWrapper(n, ITEM_TYPE_NOTE))
-        for c in cards: wrappers.append(VaultItemWrapper(c, ITEM_TYPE_CARD))
-        self.model.add_items(wrappers)
+        was_dynamic = self.proxy_model.dynamicSortFilter()
+        self.proxy_model.setDynamicSortFilter(False)
+        try:
+            self.model.add_items(credentials, notes, cards)
+        finally:
+            self.proxy_model.setDynamicSortFilter(was_dynamic)
+            self.proxy_model.invalidate()
+            
+    def add_item(self, item):
+        self.model.add_item(_wrap(item))
+        self._refilter_row_change()
+
+    def update_item(self, item) -> bool:
+        # Rewrites just this item's row; False if it is not in the list
+        updated = self.model.update_item(_wrap(item))
+        if updated:
+            self._refilter_row_change()
+        return updated
+
+    def remove_item(self, type_, item_id) -> bool:
+        return self.model.remove_item(type_, item_id)
+
+    def _refilter_row_change(self):
+        # A dynamic proxy re-checks the touched row by itself; otherwise the
+        # row's category/folder membership would go stale, so filter again
+        if not self.proxy_model.dynamicSortFilter():
+            self.proxy_model.invalidateFilter()
             
     def set_filter(self, category, folder_id=None):
         label_map = {
@@ -514,7 +965,13 @@ class CredentialsList(QWidget):
         self.proxy_model.set_category_filter(category, folder_id)
         
     def on_search_changed(self, query):
-        self.proxy_model.set_search_query(query)
+        # Debounce: each keystroke restarts the timer, so a burst of typing
+        # triggers a single filter pass once input pauses
+        self._pending_query = query
+        self._search_timer.start()
+
+    def _apply_search(self):
+        self.proxy_model.set_search_query(self._pending_query)
         
     def on_selection_changed(self, current, previous):
         if not current.isValid():
@@ -549,13 +1006,14 @@ class CredentialsList(QWidget):
         
         action = menu.exec(self.sort_btn.mapToGlobal(self.sort_btn.rect().bottomLeft()))
         
+        # Sort the source model in one pass; the proxy is never given a sort
+        # column, so it keeps source order and Qt never runs its per-comparison
+        # lessThan() path. Dynamic filtering stays on so edited rows re-filter.
         if action == a_name:
-            self.proxy_model.setSortRole(VaultModel.TitleRole)
-            self.proxy_model.sort(0, self.proxy_model.sortOrder())
+            self.model.sort_by(VaultModel.TitleRole, self.model.sort_order)
         elif action == a_date:
-            self.proxy_model.setSortRole(VaultModel.SortDateRole)
-            self.proxy_model.sort(0, self.proxy_model.sortOrder())
+            self.model.sort_by(VaultModel.SortDateRole, self.model.sort_order)
         elif action == a_asc:
-            self.proxy_model.sort(0, Qt.AscendingOrder)
+            self.model.sort_by(self.model.sort_role or VaultModel.TitleRole, Qt.AscendingOrder)
         elif action == a_desc:
-            self.proxy_model.sort(0, Qt.DescendingOrder)
+            self.model.sort_by(self.model.sort_role or VaultModel.TitleRole, Qt.DescendingOrder)
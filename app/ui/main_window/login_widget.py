@@ -1,14 +1,13 @@
 
 from PySide6.QtWidgets import (
 
-    QWidget, QVBoxLayout, QFrame, QLabel, QLineEdit, QPushButton, QHBoxLayout
+    QWidget, QVBoxLayout, QFrame, QLabel, QLineEdit, QPushButton, QHBoxLayout, QStackedWidget
 
 )
 
 from PySide6.QtGui import QIcon
 
-from PySide6.QtCore import Qt, Signal, QThread
-from app.ui.components.svg_spinner import SvgSpinner
+from PySide6.QtCore import Qt, Signal, Slot, QObject, QRunnable, QThreadPool, QEvent
 
 from app.core.auth import AuthManager
 
@@ -16,25 +15,43 @@ from app.ui.theme import get_theme
 
 from app.ui.ui_utils import load_svg_icon
 
-class LoginWorker(QThread):
+def _wipe(buf: bytearray):
+
+    buf[:] = bytes(len(buf))
+
+class LoginSignals(QObject):
     finished = Signal(bool, str)
 
-    def __init__(self, auth_manager, password):
+class LoginTask(QRunnable):
+
+    def __init__(self, auth_manager, password_buf, signals):
         super().__init__()
         self.auth = auth_manager
-        self.password = password
+        self.password_buf = password_buf
+        self.signals = signals
 
     def run(self):
+        # The password arrives as a mutable buffer so the handoff copy can be
+        # wiped once AuthManager (which takes a str) is done with it
         try:
+            password = self.password_buf.decode("utf-8")
             if self.auth.is_first_run():
-                self.auth.create_master_password(self.password)
+                self.auth.create_master_password(password)
             else:
-                self.auth.verify_master_password(self.password)
-            self.finished.emit(True, "")
+                self.auth.verify_master_password(password)
+            self._emit(True, "")
         except ValueError as e:
-            self.finished.emit(False, str(e))
+            self._emit(False, str(e))
         except Exception as e:
-            self.finished.emit(False, f"An unexpected error occurred: {str(e)}")
+            self._emit(False, f"An unexpected error occurred: {str(e)}")
+        finally:
+            _wipe(self.password_buf)
+
+    def _emit(self, success, message):
+        try:
+            self.signals.finished.emit(success, message)
+        except RuntimeError:
+            pass  # login widget was destroyed mid-verification
 
 class LoginWidget(QWidget):
 
@@ -46,52 +63,148 @@ class LoginWidget(QWidget):
 
         self.auth = auth
 
-        self.setup_ui()
+        self.spinner = None
+
+        self._focus_frames = {}  # line edit -> the field frame it highlights
+
+        self._toggle_icons = {}  # icon colour -> (view, hide) QIcons
+
+        # is_first_run() reads the auth config from disk; ask once
+        self._first_run = self.auth.is_first_run()
+
+        # Attempts run as pooled tasks; results always cross back to the UI
+        # thread, so the connection is queued explicitly
+        self._signals = LoginSignals(self)
+
+        self._signals.finished.connect(self.on_login_finished, Qt.QueuedConnection)
+
+        # The widget tree is built on first show, not at construction
+        self._ui_built = False
+
+    def showEvent(self, event):
+
+        if not self._ui_built:
+
+            self._ui_built = True
+
+            self.setup_ui()
+
+        super().showEvent(event)
 
     def setup_ui(self):
 
         theme = get_theme()
 
-        layout = QVBoxLayout(self)
+        colors = theme.colors
 
-        layout.setAlignment(Qt.AlignCenter)
+        # One stylesheet for the whole login screen, keyed by object name, so
+        # theme colours are substituted and parsed once. Font sizes stay in
+        # here: the app stylesheet sets font-size on every QWidget, which
+        # would override a font assigned with setFont()
+        self.setStyleSheet(f"""
+            QLabel#LoginLogo {{
 
-        layout.setSpacing(24)
+                background-color: {colors.primary};
+                border-radius: 24px;
+            }}
+            QLabel#LoginTitle {{
+
+                color: {colors.foreground};
+                font-size: 28px;
+                font-weight: 700;
+            }}
+            QLabel#LoginSubtitle {{
 
-        logo_container = QFrame()
+                color: {colors.muted_foreground};
+                font-size: 14px;
+            }}
+            QFrame#LoginCard {{
 
-        logo_container.setFixedSize(100, 100)
+                background-color: {colors.card};
+                border-radius: 12px;
+                border: 1px solid {colors.border};
+            }}
+            QFrame#LoginInput {{
 
-        logo_container.setStyleSheet(f"""
-            background-color: {theme.colors.primary};
-            border-radius: 24px;
+                background-color: {colors.input};
+                border: 1px solid {colors.border};
+                border-radius: 8px;
+            }}
+            QFrame#LoginInput[focused="true"] {{
+
+                border: 1px solid {colors.ring};
+            }}
+            QFrame#LoginInput QLineEdit {{
+
+                border: none;
+                background: transparent;
+                font-size: 14px;
+                color: {colors.foreground};
+                padding: 8px;
+            }}
+            QPushButton#LoginToggleBtn {{
+
+                border: none;
+                background: transparent;
+                padding: 0;
+            }}
+            QLabel#LoginError {{
+
+                color: {colors.destructive};
+                font-size: 13px;
+                padding: 8px;
+                background-color: rgba(239, 68, 68, 0.1);
+                border: 1px solid {colors.border};
+                border-radius: 6px;
+            }}
+            QStackedWidget#LoginActions {{
+
+                background: transparent;
+            }}
+            QPushButton#LoginPrimaryBtn {{
+
+                background-color: {colors.primary};
+                color: {colors.primary_foreground};
+                border: none;
+                border-radius: 8px;
+                padding: 12px 24px;
+                font-size: 14px;
+                font-weight: 600;
+            }}
+            QPushButton#LoginPrimaryBtn:hover {{
+
+                background-color: {colors.ring};
+            }}
         """)
 
-        logo_layout = QVBoxLayout(logo_container)
+        layout = QVBoxLayout(self)
+
+        layout.setAlignment(Qt.AlignCenter)
+
+        layout.setSpacing(24)
+
+        # A single label draws both the rounded tile and the centred glyph
+        logo = QLabel()
 
-        logo_icon = QLabel()
+        logo.setFixedSize(100, 100)
 
-        logo_icon.setPixmap(load_svg_icon("lock", 48, "#ffffff"))
+        logo.setObjectName("LoginLogo")
 
-        logo_icon.setAlignment(Qt.AlignCenter)
+        logo.setPixmap(load_svg_icon("lock", 48, "#ffffff"))
 
-        logo_layout.addWidget(logo_icon)
+        logo.setAlignment(Qt.AlignCenter)
 
-        layout.addWidget(logo_container, alignment=Qt.AlignCenter)
+        layout.addWidget(logo, alignment=Qt.AlignCenter)
 
         title = QLabel("VaultKeeper")
 
-        title.setStyleSheet(f"""
-            color: {theme.colors.foreground};
-            font-size: 28px;
-            font-weight: 700;
-        """)
+        title.setObjectName("LoginTitle")
 
         title.setAlignment(Qt.AlignCenter)
 
         layout.addWidget(title)
 
-        if self.auth.is_first_run():
+        if self._first_run:
 
             subtitle_text = "Create your master password to get started"
 
@@ -99,16 +212,13 @@ class LoginWidget(QWidget):
 
             subtitle_text = "Enter your master password to unlock"
 
-        subtitle = QLabel(subtitle_text)
+        self.subtitle_label = QLabel(subtitle_text)
 
-        subtitle.setStyleSheet(f"""
-            color: {theme.colors.muted_foreground};
-            font-size: 14px;
-        """)
+        self.subtitle_label.setObjectName("LoginSubtitle")
 
-        subtitle.setAlignment(Qt.AlignCenter)
+        self.subtitle_label.setAlignment(Qt.AlignCenter)
 
-        layout.addWidget(subtitle)
+        layout.addWidget(self.subtitle_label)
 
         layout.addSpacing(16)
 
@@ -116,14 +226,7 @@ class LoginWidget(QWidget):
 
         input_card.setFixedWidth(360)
 
-        input_card.setStyleSheet(f"""
-            QFrame {{
-
-                background-color: {theme.colors.card};
-                border-radius: 12px;
-                border: 1px solid {theme.colors.border};
-            }}
-        """)
+        input_card.setObjectName("LoginCard")
 
         card_layout = QVBoxLayout(input_card)
 
@@ -133,7 +236,7 @@ class LoginWidget(QWidget):
 
         self.password_container, self.password_input = self.create_password_field(
 
-            "Master Password", theme.colors.muted_foreground
+            "Master Password", colors.muted_foreground
 
         )
 
@@ -141,11 +244,11 @@ class LoginWidget(QWidget):
 
         card_layout.addWidget(self.password_container)
 
-        if self.auth.is_first_run():
+        if self._first_run:
 
             self.confirm_container, self.confirm_input = self.create_password_field(
 
-                "Confirm Password", theme.colors.muted_foreground
+                "Confirm Password", colors.muted_foreground
 
             )
 
@@ -155,13 +258,7 @@ class LoginWidget(QWidget):
 
         self.error_label = QLabel()
 
-        self.error_label.setStyleSheet(f"""
-            color: {theme.colors.destructive};
-            font-size: 13px;
-            padding: 8px;
-            background-color: rgba(239, 68, 68, 0.1);
-            border-radius: 6px;
-        """)
+        self.error_label.setObjectName("LoginError")
 
         self.error_label.setAlignment(Qt.AlignCenter)
 
@@ -169,60 +266,53 @@ class LoginWidget(QWidget):
 
         card_layout.addWidget(self.error_label)
 
-        self.login_btn = QPushButton("Unlock" if not self.auth.is_first_run() else "Create Vault")
+        self.login_btn = QPushButton("Unlock" if not self._first_run else "Create Vault")
 
         self.login_btn.setCursor(Qt.PointingHandCursor)
 
-        self.login_btn.setStyleSheet(f"""
-            QPushButton {{
+        self.login_btn.setObjectName("LoginPrimaryBtn")
 
-                background-color: {theme.colors.primary};
-                color: {theme.colors.primary_foreground};
-                border: none;
-                border-radius: 8px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
+        self.login_btn.clicked.connect(self.handle_login)
 
-                background-color: {theme.colors.ring};
-            }}
-        """)
+        # The button and the spinner share one slot; switching pages is a
+        # single layout change instead of hiding one and showing the other
+        self.action_stack = QStackedWidget()
 
-        self.login_btn.clicked.connect(self.handle_login)
+        self.action_stack.setObjectName("LoginActions")
 
-        card_layout.addWidget(self.login_btn)
-        
-        # Add Spinner (Hidden by default)
-        self.spinner_container = QWidget()
-        self.spinner_container.setFixedHeight(40)
-        spinner_layout = QHBoxLayout(self.spinner_container)
-        spinner_layout.setContentsMargins(0, 0, 0, 0)
-        spinner_layout.setAlignment(Qt.AlignCenter)
-        self.spinner = SvgSpinner(size=24, parent=self.spinner_container)
-        spinner_layout.addWidget(self.spinner)
-        card_layout.addWidget(self.spinner_container)
-        self.spinner_container.hide()
+        self.action_stack.addWidget(self.login_btn)
+
+        card_layout.addWidget(self.action_stack)
 
         layout.addWidget(input_card, alignment=Qt.AlignCenter)
 
+    @Slot(bool)
     def set_loading(self, loading: bool):
-        self.login_btn.setVisible(not loading)
-        self.spinner_container.setVisible(loading)
+        if loading and self.spinner is None:
+            # Built on the first attempt only; most unlocks never need it
+            from app.ui.components.svg_spinner import SvgSpinner
+            
+            # The spinner paints centred, so it can fill its page directly
+            self.spinner = SvgSpinner(size=24)
+            self.spinner.setFixedHeight(40)
+            self.spinner.setMaximumWidth(16777215)  # QWIDGETSIZE_MAX
+            self.action_stack.addWidget(self.spinner)
+            
+        self.action_stack.setCurrentIndex(1 if loading else 0)
         self.password_input.setEnabled(not loading)
-        if hasattr(self, 'confirm_input'):
+        if self._first_run:
             self.confirm_input.setEnabled(not loading)
             
         if loading:
             self.spinner.start()
             self.error_label.hide()
-        else:
+        elif self.spinner is not None:
             self.spinner.stop()
 
+    @Slot()
     def handle_login(self):
 
-        password = self.password_input.text()
+        password = bytearray(self.password_input.text(), "utf-8")
 
         if not password:
 
@@ -230,53 +320,72 @@ class LoginWidget(QWidget):
 
             return
 
-        if self.auth.is_first_run():
-             confirm = self.confirm_input.text()
-             if password != confirm:
+        if self._first_run:
+             confirm = bytearray(self.confirm_input.text(), "utf-8")
+             matches = password == confirm
+             _wipe(confirm)
+             if not matches:
+                 _wipe(password)
                  self.show_error("Passwords don't match")
                  return
 
         self.set_loading(True)
-        
-        self.worker = LoginWorker(self.auth, password)
-        self.worker.finished.connect(self.on_login_finished)
-        self.worker.start()
 
+        QThreadPool.globalInstance().start(LoginTask(self.auth, password, self._signals))
+
+    @Slot(bool, str)
     def on_login_finished(self, success, message):
         self.set_loading(False)
         self.setCursor(Qt.ArrowCursor)
         
         if success:
             self.password_input.clear()
-            if hasattr(self, 'confirm_input'):
+            if self._first_run:
+                # The vault now exists; later unlocks only need the password
                 self.confirm_input.clear()
+                self.confirm_container.hide()
+                self.subtitle_label.setText("Enter your master password to unlock")
+                self.login_btn.setText("Unlock")
+                self._first_run = False
             self.error_label.hide()
             self.login_success.emit()
         else:
             self.show_error(message)
 
+    @Slot(str)
     def show_error(self, message: str):
 
         self.error_label.setText(message)
 
         self.error_label.show()
 
-    def create_password_field(self, placeholder: str, icon_color: str):
+    def eventFilter(self, obj, event):
 
-        theme = get_theme()
+        if event.type() in (QEvent.FocusIn, QEvent.FocusOut):
+
+            frame = self._focus_frames.get(obj)
+
+            if frame is not None:
+
+                frame.setProperty("focused", event.type() == QEvent.FocusIn)
+
+                frame.style().unpolish(frame)
+
+                frame.style().polish(frame)
+
+        return super().eventFilter(obj, event)
+
+    def create_password_field(self, placeholder: str, icon_color: str):
 
         container = QFrame()
 
         container.setCursor(Qt.IBeamCursor)
 
-        container.setStyleSheet(f"""
-            QFrame {{
+        # Both focus states live in the login stylesheet; focus changes only
+        # flip this property
+        container.setObjectName("LoginInput")
 
-                background-color: {theme.colors.input};
-                border: 1px solid {theme.colors.border};
-                border-radius: 8px;
-            }}
-        """)
+        container.setProperty("focused", False)
 
         layout = QHBoxLayout(container)
 
@@ -290,33 +399,38 @@ class LoginWidget(QWidget):
 
         line_edit.setPlaceholderText(placeholder)
 
-        line_edit.setStyleSheet(f"""
-            border: none;
-            background: transparent;
-            font-size: 14px;
-            color: {theme.colors.foreground};
-            padding: 8px;
-        """)
-
         toggle_btn = QPushButton()
 
         toggle_btn.setCursor(Qt.PointingHandCursor)
 
-        toggle_btn.setIcon(QIcon(load_svg_icon("view", 16, icon_color)))
+        # Toggle icons are shared by every field drawn in the same colour
+        icons = self._toggle_icons.get(icon_color)
+
+        if icons is None:
+
+            icons = self._toggle_icons[icon_color] = (
+                QIcon(load_svg_icon("view", 16, icon_color)),
+                QIcon(load_svg_icon("visibility_off", 16, icon_color)),
+            )
+
+        view_icon, hide_icon = icons
+
+        toggle_btn.setIcon(view_icon)
 
         toggle_btn.setFixedSize(24, 24)
 
         toggle_btn.setToolTip("Show Password")
 
-        toggle_btn.setStyleSheet("border: none; background: transparent; padding: 0;")
+        toggle_btn.setObjectName("LoginToggleBtn")
 
+        @Slot()
         def toggle():
 
             if line_edit.echoMode() == QLineEdit.Password:
 
                 line_edit.setEchoMode(QLineEdit.Normal)
 
-                toggle_btn.setIcon(QIcon(load_svg_icon("visibility_off", 16, icon_color)))
+                toggle_btn.setIcon(hide_icon)
 
                 toggle_btn.setToolTip("Hide Password")
 
@@ -324,7 +438,7 @@ class LoginWidget(QWidget):
 
                 line_edit.setEchoMode(QLineEdit.Password)
 
-                toggle_btn.setIcon(QIcon(load_svg_icon("view", 16, icon_color)))
+                toggle_btn.setIcon(view_icon)
 
                 toggle_btn.setToolTip("Show Password")
 
@@ -334,38 +448,8 @@ class LoginWidget(QWidget):
 
         layout.addWidget(toggle_btn)
 
-        original_focus_in = line_edit.focusInEvent
-
-        original_focus_out = line_edit.focusOutEvent
-
-        def focus_in(event):
-
-            container.setStyleSheet(f"""
-                QFrame {{
-
-                    background-color: {theme.colors.input};
-                    border: 1px solid {theme.colors.ring};
-                    border-radius: 8px;
-                }}
-            """)
-
-            original_focus_in(event)
-
-        def focus_out(event):
-
-            container.setStyleSheet(f"""
-                QFrame {{
-
-                    background-color: {theme.colors.input};
-                    border: 1px solid {theme.colors.border};
-                    border-radius: 8px;
-                }}
-            """)
-
-            original_focus_out(event)
-
-        line_edit.focusInEvent = focus_in
+        self._focus_frames[line_edit] = container
 
-        line_edit.focusOutEvent = focus_out
+        line_edit.installEventFilter(self)
 
         return container, line_edit
@@ -1,26 +1,157 @@
 
-from typing import List
+from functools import lru_cache, partial
+
+from typing import Dict, List
 
 from PySide6.QtWidgets import (
 
-    QFrame, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QWidget, QMenu
+    QFrame, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QWidget, QMenu, QLayout
 
 )
 
-from PySide6.QtCore import Qt, Signal, QSize, QTimer
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QTimer, QMetaObject, Q_ARG
 
-from PySide6.QtGui import QIcon, QAction
+from PySide6.QtGui import QAction
 
 from app.core.vault import Folder
 
 from app.core.gdrive import GoogleDriveManager
 
-from app.ui.theme import get_theme
+from app.ui.theme import Theme, ThemeMode, get_theme
 
-from app.ui.ui_utils import load_svg_icon, create_icon_button
+from app.ui.ui_utils import load_svg_icon, load_svg_qicon, create_icon_button
 
 from app.ui.components.sidebar import SidebarButton
 
+@lru_cache(maxsize=4)
+def _sidebar_styles(mode: ThemeMode) -> Dict[str, str]:
+    # Stylesheets formatted once per theme mode. The sidebar applies a single
+    # sheet to itself and styles its children by object name
+
+    c = Theme(mode).colors
+
+    return {
+
+        "sidebar": f"""
+            #SidebarFrame {{
+
+                background-color: {c.sidebar};
+            }}
+            #SidebarFrame QLabel {{
+
+                background-color: transparent;
+            }}
+            #SidebarFrame QPushButton {{
+
+                background-color: transparent;
+            }}
+            #SidebarFrame #SidebarSection {{
+
+                background-color: transparent;
+            }}
+            #SidebarFrame #SidebarAppName {{
+
+                color: {c.sidebar_foreground};
+                font-size: 16px;
+                font-weight: 600;
+            }}
+            #SidebarFrame #SidebarVaultsTitle {{
+
+                color: {c.sidebar_muted};
+                font-size: 11px;
+                font-weight: 600;
+                letter-spacing: 0.5px;
+            }}
+            #SidebarFrame #SidebarToggleBtn {{
+
+                border: none;
+                border-radius: 6px;
+            }}
+            #SidebarFrame #SidebarAddFolderBtn {{
+
+                border: none;
+                border-radius: 4px;
+            }}
+            #SidebarFrame #SidebarToggleBtn:hover, #SidebarFrame #SidebarAddFolderBtn:hover {{
+
+                background-color: {c.sidebar_accent};
+            }}
+            #SidebarFrame #SidebarSyncStatus {{
+
+                color: #3b82f6;
+                font-size: 12px;
+                font-weight: 500;
+            }}
+            #SidebarFrame #SidebarSyncStatus[syncState="ok"] {{
+
+                color: #22c55e;
+            }}
+            #SidebarFrame #SidebarSyncStatus[syncState="failed"] {{
+
+                color: #ef4444;
+            }}
+            #SidebarFrame #SidebarFooterBtn {{
+
+                color: {c.sidebar_foreground};
+                border: none;
+                border-radius: 8px;
+                padding: 10px 12px;
+                text-align: left;
+                font-size: 13px;
+                font-weight: 500;
+            }}
+            #SidebarFrame #SidebarFooterBtn:hover {{
+
+                background-color: {c.sidebar_accent};
+            }}
+            #SidebarFrame #SidebarAddBtn {{
+
+                background-color: {c.primary};
+                color: white;
+                border: none;
+                border-radius: 8px;
+                padding: 12px 24px;
+                font-weight: 600;
+                font-size: 14px;
+                text-align: center;
+            }}
+            #SidebarFrame #SidebarAddBtn:hover {{
+
+                background-color: {c.accent};
+            }}
+        """,
+
+        "menu": f"""
+            QMenu {{
+
+                background-color: {c.card};
+                border: 1px solid {c.border};
+                border-radius: 8px;
+                padding: 4px;
+            }}
+            QMenu::item {{
+
+                color: {c.foreground};
+                padding: 8px 16px;
+                border-radius: 4px;
+            }}
+            QMenu::item:selected {{
+
+                background-color: {c.accent};
+            }}
+        """,
+    }
+
+_VAULT_SECTIONS = {
+
+    "personal": ("person", "Personal"),
+
+    "team": ("team", "Team Vault"),
+
+    "professional": ("work", "Professional"),
+
+}
+
 class Sidebar(QFrame):
 
     category_changed = Signal(str)
@@ -59,28 +190,39 @@ class Sidebar(QFrame):
 
         self.folder_buttons = []
 
-        self.setup_ui()
+        self._folder_btn_by_key = {}
 
-    def setup_ui(self):
+        self._folder_menu = None
 
-        theme = get_theme()
+        self._menu_folder = None
 
-        self.setFrameShape(QFrame.NoFrame)
+        self._drive_connected = False
 
-        self.setStyleSheet(f"""
-            #SidebarFrame {{
+        # Folder lists can arrive in bursts during a sync; only the last one
+        # within the window is rebuilt
+        self._pending_folders = None
 
-                background-color: {theme.colors.sidebar};
-            }}
-            #SidebarFrame QLabel {{
+        self._rebuild_timer = QTimer(self)
 
-                background-color: transparent;
-            }}
-            #SidebarFrame QPushButton {{
+        self._rebuild_timer.setSingleShot(True)
 
-                background-color: transparent;
-            }}
-        """)
+        self._rebuild_timer.setInterval(50)
+
+        self._rebuild_timer.timeout.connect(self._do_rebuild_folders, Qt.DirectConnection)
+
+        self._theme = get_theme()
+
+        self.setup_ui()
+
+    def setup_ui(self):
+
+        theme = self._theme
+
+        styles = _sidebar_styles(theme.mode)
+
+        self.setFrameShape(QFrame.NoFrame)
+
+        self.setStyleSheet(styles["sidebar"])
 
         self.layout = QVBoxLayout(self)
 
@@ -94,19 +236,15 @@ class Sidebar(QFrame):
 
         header_layout.setSpacing(8)
 
-        logo_icon = QLabel()
+        self.logo_icon = QLabel()
 
-        logo_icon.setPixmap(load_svg_icon("shield", 24, theme.colors.primary))
+        self.logo_icon.setPixmap(load_svg_icon("shield", 24, theme.colors.primary))
 
-        header_layout.addWidget(logo_icon, alignment=Qt.AlignVCenter)
+        header_layout.addWidget(self.logo_icon, alignment=Qt.AlignVCenter)
 
         app_name = QLabel("VaultKeeper")
 
-        app_name.setStyleSheet(f"""
-            color: {theme.colors.sidebar_foreground};
-            font-size: 16px;
-            font-weight: 600;
-        """)
+        app_name.setObjectName("SidebarAppName")
 
         header_layout.addWidget(app_name, alignment=Qt.AlignVCenter)
 
@@ -116,20 +254,11 @@ class Sidebar(QFrame):
 
         self.toggle_btn.setFixedSize(28, 28)
 
-        self.toggle_btn.setStyleSheet(f"""
-            QPushButton {{
-
-                background-color: transparent;
-                border: none;
-                border-radius: 6px;
-            }}
-            QPushButton:hover {{
-
-                background-color: {theme.colors.sidebar_accent};
-            }}
-        """)
+        self.toggle_btn.setObjectName("SidebarToggleBtn")
 
-        self.toggle_btn.clicked.connect(self.toggle_sidebar.emit)
+        # Everything wired here lives on the GUI thread, so connections are
+        # direct; Drive callbacks are marshalled in _on_sync_start/_on_sync_end
+        self.toggle_btn.clicked.connect(self.toggle_sidebar.emit, Qt.DirectConnection)
 
         header_layout.addWidget(self.toggle_btn, alignment=Qt.AlignVCenter)
 
@@ -139,41 +268,41 @@ class Sidebar(QFrame):
 
         self.btn_all.setChecked(True)
 
-        self.btn_all.clicked.connect(lambda: self.set_category("all"))
+        self.btn_all.clicked.connect(partial(self._select_category, "all"), Qt.DirectConnection)
 
         self.layout.addWidget(self.btn_all)
 
         self.btn_favorites = SidebarButton("star", "Favorites")
 
-        self.btn_favorites.clicked.connect(lambda: self.set_category("favorites"))
+        self.btn_favorites.clicked.connect(partial(self._select_category, "favorites"), Qt.DirectConnection)
 
         self.layout.addWidget(self.btn_favorites)
 
         self.btn_watchtower = SidebarButton("view", "Watchtower")
-        self.btn_watchtower.clicked.connect(lambda: self.set_category("watchtower"))
+        self.btn_watchtower.clicked.connect(partial(self._select_category, "watchtower"), Qt.DirectConnection)
         self.layout.addWidget(self.btn_watchtower)
 
         self.btn_secure_notes = SidebarButton("note", "Secure Notes")
 
-        self.btn_secure_notes.clicked.connect(lambda: self.set_category("secure_notes"))
+        self.btn_secure_notes.clicked.connect(partial(self._select_category, "secure_notes"), Qt.DirectConnection)
 
         self.layout.addWidget(self.btn_secure_notes)
 
         self.btn_credit_cards = SidebarButton("credit_card", "Credit Cards")
 
-        self.btn_credit_cards.clicked.connect(lambda: self.set_category("credit_cards"))
+        self.btn_credit_cards.clicked.connect(partial(self._select_category, "credit_cards"), Qt.DirectConnection)
 
         self.layout.addWidget(self.btn_credit_cards)
 
         self.btn_generator = SidebarButton("key", "Generator")
 
-        self.btn_generator.clicked.connect(lambda: self.set_category("generator"))
+        self.btn_generator.clicked.connect(partial(self._select_category, "generator"), Qt.DirectConnection)
 
         self.layout.addWidget(self.btn_generator)
 
         vaults_header = QWidget()
 
-        vaults_header.setStyleSheet("background-color: transparent;")
+        vaults_header.setObjectName("SidebarSection")
 
         vaults_header_layout = QHBoxLayout(vaults_header)
 
@@ -183,46 +312,29 @@ class Sidebar(QFrame):
 
         vaults_title = QLabel("VAULTS")
 
-        vaults_title.setStyleSheet(f"""
-            color: {theme.colors.sidebar_muted};
-            font-size: 11px;
-            font-weight: 600;
-            letter-spacing: 0.5px;
-            background-color: transparent;
-        """)
+        vaults_title.setObjectName("SidebarVaultsTitle")
 
         vaults_header_layout.addWidget(vaults_title, alignment=Qt.AlignVCenter)
 
         vaults_header_layout.addStretch()
 
-        add_folder_btn = create_icon_button("add", 12, theme.colors.sidebar_muted)
-
-        add_folder_btn.setFixedSize(18, 18)
-
-        add_folder_btn.setStyleSheet(f"""
-            QPushButton {{
+        self.add_folder_btn = create_icon_button("add", 12, theme.colors.sidebar_muted)
 
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
+        self.add_folder_btn.setFixedSize(18, 18)
 
-                background-color: {theme.colors.sidebar_accent};
-            }}
-        """)
+        self.add_folder_btn.setObjectName("SidebarAddFolderBtn")
 
-        add_folder_btn.setToolTip("Create new folder")
+        self.add_folder_btn.setToolTip("Create new folder")
 
-        add_folder_btn.clicked.connect(self.add_folder_clicked.emit)
+        self.add_folder_btn.clicked.connect(self.add_folder_clicked.emit, Qt.DirectConnection)
 
-        vaults_header_layout.addWidget(add_folder_btn, alignment=Qt.AlignVCenter)
+        vaults_header_layout.addWidget(self.add_folder_btn, alignment=Qt.AlignVCenter)
 
         self.layout.addWidget(vaults_header)
 
         self.folders_container = QWidget()
 
-        self.folders_container.setStyleSheet("background-color: transparent;")
+        self.folders_container.setObjectName("SidebarSection")
 
         self.folders_layout = QVBoxLayout(self.folders_container)
 
@@ -232,63 +344,38 @@ class Sidebar(QFrame):
 
         self.layout.addWidget(self.folders_container)
 
-        self.btn_personal = SidebarButton("person", "Personal", font_size=16, is_selectable=False)
+        # Team and professional sections are only built once a folder needs them
+        self._vault_sections = {}
 
-        self.folders_layout.addWidget(self.btn_personal)
+        self.btn_personal, self.personal_folders_container, self.personal_folders_layout = (
 
-        self.personal_folders_container = QWidget()
+            self._ensure_vault_section("personal")
 
-        self.personal_folders_container.setStyleSheet("background-color: transparent;")
+        )
 
-        self.personal_folders_layout = QVBoxLayout(self.personal_folders_container)
-
-        self.personal_folders_layout.setContentsMargins(0, 0, 0, 0)
-
-        self.personal_folders_layout.setSpacing(2)
-
-        self.folders_layout.addWidget(self.personal_folders_container)
-
-        self.btn_team = SidebarButton("team", "Team Vault", font_size=16, is_selectable=False)
-
-        self.folders_layout.addWidget(self.btn_team)
-
-        self.team_folders_container = QWidget()
-
-        self.team_folders_container.setStyleSheet("background-color: transparent;")
-
-        self.team_folders_layout = QVBoxLayout(self.team_folders_container)
-
-        self.team_folders_layout.setContentsMargins(0, 0, 0, 0)
-
-        self.team_folders_layout.setSpacing(2)
-
-        self.folders_layout.addWidget(self.team_folders_container)
-
-        self.btn_professional = SidebarButton("work", "Professional", font_size=16, is_selectable=False)
+        self.static_buttons = [
 
-        self.folders_layout.addWidget(self.btn_professional)
+            self.btn_all, self.btn_favorites, self.btn_watchtower, self.btn_secure_notes, self.btn_credit_cards, self.btn_generator
 
-        self.professional_folders_container = QWidget()
+        ]
 
-        self.professional_folders_container.setStyleSheet("background-color: transparent;")
+        self._btn_map = {
 
-        self.professional_folders_layout = QVBoxLayout(self.professional_folders_container)
+            "all": self.btn_all,
 
-        self.professional_folders_layout.setContentsMargins(0, 0, 0, 0)
+            "favorites": self.btn_favorites,
 
-        self.professional_folders_layout.setSpacing(2)
+            "watchtower": self.btn_watchtower,
 
-        self.folders_layout.addWidget(self.professional_folders_container)
+            "secure_notes": self.btn_secure_notes,
 
-        self.static_buttons = [
+            "credit_cards": self.btn_credit_cards,
 
-            self.btn_all, self.btn_favorites, self.btn_watchtower, self.btn_secure_notes, self.btn_credit_cards, self.btn_generator
+            "generator": self.btn_generator,
 
-        ]
+        }
 
         self.personal_folders_container.setVisible(False)
-        self.team_folders_container.setVisible(False)
-        self.professional_folders_container.setVisible(False)
 
         self.layout.addStretch()
 
@@ -298,8 +385,6 @@ class Sidebar(QFrame):
 
         bottom_layout.setSpacing(4)
 
-        theme = get_theme()
-
         self.sync_status_widget = QWidget()
 
         self.sync_status_widget.setVisible(False)
@@ -320,11 +405,9 @@ class Sidebar(QFrame):
 
         self.sync_status_label = QLabel("Syncing...")
 
-        self.sync_status_label.setStyleSheet("""
-            color: #3b82f6;
-            font-size: 12px;
-            font-weight: 500;
-        """)
+        self.sync_status_label.setObjectName("SidebarSyncStatus")
+
+        self.sync_status_label.setProperty("syncState", "syncing")
 
         sync_status_layout.addWidget(self.sync_status_label)
 
@@ -332,9 +415,15 @@ class Sidebar(QFrame):
 
         bottom_layout.addWidget(self.sync_status_widget)
 
+        self._sync_hide_timer = QTimer(self)
+
+        self._sync_hide_timer.setSingleShot(True)
+
+        self._sync_hide_timer.timeout.connect(self.sync_status_widget.hide, Qt.DirectConnection)
+
         self.drive_btn = QPushButton()
 
-        self.drive_btn.setIcon(QIcon(load_svg_icon("google_drive", 18, theme.colors.sidebar_foreground)))
+        self.drive_btn.setIcon(load_svg_qicon("google_drive", 18, theme.colors.sidebar_foreground))
 
         self.drive_btn.setIconSize(QSize(18, 18))
 
@@ -342,31 +431,15 @@ class Sidebar(QFrame):
 
         self.drive_btn.setCursor(Qt.PointingHandCursor)
 
-        self.drive_btn.setStyleSheet(f"""
-            QPushButton {{
-
-                background-color: transparent;
-                color: {theme.colors.sidebar_foreground};
-                border: none;
-                border-radius: 8px;
-                padding: 10px 12px;
-                text-align: left;
-                font-size: 13px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-
-                background-color: {theme.colors.sidebar_accent};
-            }}
-        """)
+        self.drive_btn.setObjectName("SidebarFooterBtn")
 
-        self.drive_btn.clicked.connect(self.google_drive_clicked.emit)
+        self.drive_btn.clicked.connect(self.google_drive_clicked.emit, Qt.DirectConnection)
 
         bottom_layout.addWidget(self.drive_btn)
 
         self.settings_btn = QPushButton()
 
-        self.settings_btn.setIcon(QIcon(load_svg_icon("settings", 18, theme.colors.sidebar_foreground)))
+        self.settings_btn.setIcon(load_svg_qicon("settings", 18, theme.colors.sidebar_foreground))
 
         self.settings_btn.setIconSize(QSize(18, 18))
 
@@ -374,50 +447,20 @@ class Sidebar(QFrame):
 
         self.settings_btn.setCursor(Qt.PointingHandCursor)
 
-        self.settings_btn.setStyleSheet(f"""
-            QPushButton {{
+        self.settings_btn.setObjectName("SidebarFooterBtn")
 
-                background-color: transparent;
-                color: {theme.colors.sidebar_foreground};
-                border: none;
-                border-radius: 8px;
-                padding: 10px 12px;
-                text-align: left;
-                font-size: 13px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-
-                background-color: {theme.colors.sidebar_accent};
-            }}
-        """)
-
-        self.settings_btn.clicked.connect(self.settings_clicked.emit)
+        self.settings_btn.clicked.connect(self.settings_clicked.emit, Qt.DirectConnection)
 
         bottom_layout.addWidget(self.settings_btn)
 
         # New Item Button
         self.add_btn = QPushButton()
-        self.add_btn.setIcon(QIcon(load_svg_icon("add", 18, "#ffffff")))
+        self.add_btn.setIcon(load_svg_qicon("add", 18, "#ffffff"))
         self.add_btn.setIconSize(QSize(18, 18))
         self.add_btn.setText(" New Item")
         self.add_btn.setCursor(Qt.PointingHandCursor)
-        self.add_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {theme.colors.primary};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 24px;
-                font-weight: 600;
-                font-size: 14px;
-                text-align: center;
-            }}
-            QPushButton:hover {{
-                background-color: {theme.colors.accent};
-            }}
-        """)
-        self.add_btn.clicked.connect(self.add_item_clicked.emit)
+        self.add_btn.setObjectName("SidebarAddBtn")
+        self.add_btn.clicked.connect(self.add_item_clicked.emit, Qt.DirectConnection)
         bottom_layout.addWidget(self.add_btn)
 
         self.layout.addLayout(bottom_layout)
@@ -432,53 +475,57 @@ class Sidebar(QFrame):
 
     def _on_sync_start(self):
 
-        QTimer.singleShot(0, self._show_sync_indicator)
+        # Drive callbacks may fire on a worker thread; queue onto the GUI thread
+        QMetaObject.invokeMethod(self, "_show_sync_indicator", Qt.QueuedConnection)
 
     def _on_sync_end(self, success: bool, error: str = None):
 
-        QTimer.singleShot(0, lambda: self._hide_sync_indicator(success, error))
+        QMetaObject.invokeMethod(
 
+            self, "_hide_sync_indicator", Qt.QueuedConnection,
+
+            Q_ARG(bool, success), Q_ARG(str, error or "")
+
+        )
+
+    def _set_sync_state(self, state: str):
+
+        self.sync_status_label.setProperty("syncState", state)
+
+        self.sync_status_label.style().unpolish(self.sync_status_label)
+
+        self.sync_status_label.style().polish(self.sync_status_label)
+
+    @Slot()
     def _show_sync_indicator(self):
 
+        # A new sync must not be hidden by the previous one's pending timeout
+        self._sync_hide_timer.stop()
+
         self.sync_status_label.setText("Syncing...")
 
-        self.sync_status_label.setStyleSheet("""
-            color: #3b82f6;
-            font-size: 12px;
-            font-weight: 500;
-        """)
+        self._set_sync_state("syncing")
 
         self.sync_status_widget.setVisible(True)
 
         self.sync_status_widget.update()
 
-        self.update()
-
+    @Slot(bool, str)
     def _hide_sync_indicator(self, success: bool, error: str = None):
 
         if success:
 
             self.sync_status_label.setText("✓ Synced")
 
-            self.sync_status_label.setStyleSheet("""
-                color: #22c55e;
-                font-size: 12px;
-                font-weight: 500;
-            """)
+            self._set_sync_state("ok")
 
         else:
 
             self.sync_status_label.setText("✗ Sync failed")
 
-            self.sync_status_label.setStyleSheet("""
-                color: #ef4444;
-                font-size: 12px;
-                font-weight: 500;
-            """)
-
-        from PySide6.QtCore import QTimer
+            self._set_sync_state("failed")
 
-        QTimer.singleShot(2000, lambda: self.sync_status_widget.setVisible(False))
+        self._sync_hide_timer.start(2000)
 
     def update_gdrive_status(self):
 
@@ -486,165 +533,328 @@ class Sidebar(QFrame):
 
         gdrive = get_gdrive_manager()
 
-        theme = get_theme()
+        self._drive_connected = gdrive.is_connected()
+
+        self._apply_drive_status()
+
+    def _apply_drive_status(self):
 
-        if gdrive.is_connected():
+        if self._drive_connected:
 
-            self.drive_btn.setIcon(QIcon(load_svg_icon("google_drive", 18, "#22c55e")))
+            self.drive_btn.setIcon(load_svg_qicon("google_drive", 18, "#22c55e"))
 
             self.drive_btn.setText("  Google Drive ✓")
 
         else:
 
-            self.drive_btn.setIcon(QIcon(load_svg_icon("google_drive", 18, theme.colors.sidebar_foreground)))
+            self.drive_btn.setIcon(load_svg_qicon("google_drive", 18, self._theme.colors.sidebar_foreground))
 
             self.drive_btn.setText("  Google Drive Sync")
 
+    def refresh_theme(self):
+
+        self._theme = get_theme()
+
+        colors = self._theme.colors
+
+        self.setStyleSheet(_sidebar_styles(self._theme.mode)["sidebar"])
+
+        self.logo_icon.setPixmap(load_svg_icon("shield", 24, colors.primary))
+
+        self.toggle_btn.setIcon(load_svg_qicon("menu_sidebar", 18, colors.sidebar_muted))
+
+        self.add_folder_btn.setIcon(load_svg_qicon("add", 12, colors.sidebar_muted))
+
+        self.settings_btn.setIcon(load_svg_qicon("settings", 18, colors.sidebar_foreground))
+
+        self._apply_drive_status()
+
+        for btn in self.static_buttons + self.folder_buttons:
+
+            btn.update_style()
+
+        for header, _, _ in self._vault_sections.values():
+
+            header.update_style()
+
+        # The folder menu is rebuilt with the new colours on its next use
+        if self._folder_menu is not None:
+
+            self._folder_menu.deleteLater()
+
+            self._folder_menu = None
+
     def set_folders(self, folders: List[Folder]):
 
+        self._pending_folders = folders
+
+        self._rebuild_timer.start()
+
+    def showEvent(self, event):
+
+        # Apply a folder list that arrived while collapsed before the first paint
+        if self._pending_folders is not None:
+
+            self._rebuild_timer.stop()
+
+            self._do_rebuild_folders()
+
+        super().showEvent(event)
+
+    def _do_rebuild_folders(self):
+
+        # While the sidebar is collapsed keep only the latest list; it is
+        # built when the sidebar is shown again
+        if self._pending_folders is None or not self.isVisible():
+
+            return
+
+        folders, self._pending_folders = self._pending_folders, None
+
+        # Repaint and lay out the folder area once after the whole rebuild
+        # rather than after every relabel, move and visibility change
+        constraint = self.folders_layout.sizeConstraint()
+
+        self.folders_container.setUpdatesEnabled(False)
+
+        self.folders_layout.setSizeConstraint(QLayout.SetNoConstraint)
+
+        try:
+
+            self._populate_folder_buttons(folders)
+
+        finally:
+
+            self.folders_layout.setSizeConstraint(constraint)
+
+            self.folders_layout.activate()
+
+            self.folders_container.setUpdatesEnabled(True)
+
+    def _populate_folder_buttons(self, folders: List[Folder]):
+
         self.folders = folders
 
-        for btn in self.folder_buttons:
+        # Buttons keep their identity per folder id, so a rebuild only moves
+        # the ones whose vault or position changed. Removed folders leave
+        # their buttons hidden in the pool for the next new folder
+        previous = self._folder_btn_by_key
 
-            btn.deleteLater()
+        self._folder_btn_by_key = {}
 
-        self.folder_buttons.clear()
+        keys = [f"folder_{folder.id}" for folder in folders]
 
-        theme = get_theme()
+        kept = {key for key in keys if key in previous}
 
-        self.personal_folders_container.setVisible(False)
-        self.team_folders_container.setVisible(False)
-        self.professional_folders_container.setVisible(False)
+        spare = [btn for btn in self.folder_buttons if getattr(btn, "category_key", None) not in kept]
+
+        section_buttons = {}
+
+        for folder, key in zip(folders, keys):
+
+            btn = previous.get(key)
 
-        has_personal = False
-        has_team = False
-        has_professional = False
+            if btn is None:
 
-        for folder in folders:
+                if spare:
 
-            btn = SidebarButton("folder", folder.name, font_size=13, padding_left=32)
+                    btn = spare.pop(0)
 
-            btn.clicked.connect(lambda checked, f=folder: self.on_folder_clicked(f))
+                else:
 
-            btn.setContextMenuPolicy(Qt.CustomContextMenu)
+                    btn = SidebarButton("folder", folder.name, font_size=13, padding_left=32)
 
-            btn.customContextMenuRequested.connect(
+                    btn.clicked.connect(partial(self._on_folder_button_clicked, btn), Qt.DirectConnection)
 
-                lambda pos, b=btn, f=folder: self._show_folder_context_menu(b, f, pos)
+                    btn.setContextMenuPolicy(Qt.CustomContextMenu)
 
-            )
+                    btn.customContextMenuRequested.connect(partial(self._on_folder_button_menu, btn), Qt.DirectConnection)
+
+                    self.folder_buttons.append(btn)
+
+            btn.set_label(folder.name)
+
+            btn.folder = folder
+
+            # The category string is built once here, not on every click
+            btn.category_key = key
+
+            self._folder_btn_by_key[key] = btn
+
+            selected = self.current_category == key
+
+            if btn.isChecked() != selected:
+
+                btn.setChecked(selected)
 
             # Determine vault type (default to personal if not set)
             v_type = getattr(folder, 'vault_type', 'personal')
-            if v_type == 'team':
-                self.team_folders_layout.addWidget(btn)
-                has_team = True
-            elif v_type == 'professional':
-                self.professional_folders_layout.addWidget(btn)
-                has_professional = True
-            else:
-                self.personal_folders_layout.addWidget(btn)
-                has_personal = True
-
-            self.folder_buttons.append(btn)
-            
-        self.personal_folders_container.setVisible(has_personal)
-        self.team_folders_container.setVisible(has_team)
-        self.professional_folders_container.setVisible(has_professional)
+            if v_type not in _VAULT_SECTIONS:
+                v_type = 'personal'
 
-    def _show_folder_context_menu(self, button, folder: Folder, pos):
+            section_buttons.setdefault(v_type, []).append(btn)
 
-        theme = get_theme()
+        for btn in spare:
 
-        menu = QMenu(self)
+            btn.folder = None
 
-        menu.setStyleSheet(f"""
-            QMenu {{
+            btn.category_key = None
 
-                background-color: {theme.colors.card};
-                border: 1px solid {theme.colors.border};
-                border-radius: 8px;
-                padding: 4px;
-            }}
-            QMenu::item {{
+            btn.setVisible(False)
 
-                color: {theme.colors.foreground};
-                padding: 8px 16px;
-                border-radius: 4px;
-            }}
-            QMenu::item:selected {{
+        for v_type, buttons in section_buttons.items():
 
-                background-color: {theme.colors.accent};
-            }}
-        """)
+            layout = self._ensure_vault_section(v_type)[2]
 
-        edit_action = menu.addAction("Rename Folder")
+            current = [layout.itemAt(i).widget() for i in range(layout.count())]
 
-        edit_action.setIcon(QIcon(load_svg_icon("edit", 16, theme.colors.foreground)))
+            if [w for w in current if w in buttons] != buttons:
 
-        menu.addSeparator()
+                for btn in buttons:
 
-        delete_action = menu.addAction("Delete Folder")
+                    layout.addWidget(btn)
 
-        delete_action.setIcon(QIcon(load_svg_icon("delete", 16, theme.colors.destructive)))
+            for btn in buttons:
 
-        action = menu.exec_(button.mapToGlobal(pos))
+                btn.setVisible(True)
 
-        if action == edit_action:
+        for v_type, (header, container, layout) in self._vault_sections.items():
 
-            self.folder_edit_requested.emit(folder)
+            container.setVisible(v_type in section_buttons)
 
-        elif action == delete_action:
+            if v_type != 'personal':
 
-            self.folder_delete_requested.emit(folder)
+                header.setVisible(v_type in section_buttons)
 
-    def on_folder_clicked(self, folder: Folder):
+    def _ensure_vault_section(self, vault_type: str):
 
-        self.set_category(f"folder_{folder.id}")
+        section = self._vault_sections.get(vault_type)
 
-        self.folder_selected.emit(folder.id)
+        if section is not None:
 
-    def set_category(self, category: str):
+            return section
 
-        self.current_category = category
+        icon_name, title = _VAULT_SECTIONS[vault_type]
 
-        for btn in self.static_buttons + self.folder_buttons:
+        header = SidebarButton(icon_name, title, font_size=16, is_selectable=False)
 
-            if btn:
+        container = QWidget()
 
-                btn.setChecked(False)
+        container.setObjectName("SidebarSection")
 
-        btn_map = {
+        layout = QVBoxLayout(container)
 
-            "all": self.btn_all,
+        layout.setContentsMargins(0, 0, 0, 0)
 
-            "favorites": self.btn_favorites,
+        layout.setSpacing(2)
 
-            "watchtower": self.btn_watchtower,
+        # Keep sections in personal, team, professional order whichever is built first
+        order = list(_VAULT_SECTIONS)
 
-            "secure_notes": self.btn_secure_notes,
+        index = 2 * sum(1 for v in order[:order.index(vault_type)] if v in self._vault_sections)
 
-            "credit_cards": self.btn_credit_cards,
+        self.folders_layout.insertWidget(index, header)
 
-            "generator": self.btn_generator,
+        self.folders_layout.insertWidget(index + 1, container)
 
-        }
+        section = self._vault_sections[vault_type] = (header, container, layout)
+
+        return section
+
+    def _build_folder_menu(self):
+
+        theme = self._theme
+
+        self._folder_menu = QMenu(self)
+
+        self._folder_menu.setStyleSheet(_sidebar_styles(theme.mode)["menu"])
+
+        self._folder_edit_action = self._folder_menu.addAction("Rename Folder")
+
+        self._folder_edit_action.setIcon(load_svg_qicon("edit", 16, theme.colors.foreground))
 
-        if category in btn_map:
+        self._folder_menu.addSeparator()
 
-            btn_map[category].setChecked(True)
+        self._folder_delete_action = self._folder_menu.addAction("Delete Folder")
 
-        elif category.startswith("folder_"):
+        self._folder_delete_action.setIcon(load_svg_qicon("delete", 16, theme.colors.destructive))
 
-            folder_id = int(category.split("_")[1])
+    def _show_folder_context_menu(self, button, folder: Folder, pos):
+
+        # One menu serves every folder; only its target changes per right-click
+        if self._folder_menu is None:
+
+            self._build_folder_menu()
+
+        self._menu_folder = folder
+
+        action = self._folder_menu.exec_(button.mapToGlobal(pos))
+
+        if action == self._folder_edit_action:
+
+            self.folder_edit_requested.emit(self._menu_folder)
+
+        elif action == self._folder_delete_action:
+
+            self.folder_delete_requested.emit(self._menu_folder)
+
+    def _select_category(self, category: str, checked: bool = False):
+
+        self.set_category(category)
+
+    def _on_folder_button_clicked(self, button, checked: bool = False):
+
+        self.set_category(button.category_key)
+
+        self.folder_selected.emit(button.folder.id)
+
+    def _on_folder_button_menu(self, button, pos):
+
+        self._show_folder_context_menu(button, button.folder, pos)
+
+    def on_folder_clicked(self, folder: Folder):
+
+        self.set_category(f"folder_{folder.id}")
 
-            for i, folder in enumerate(self.folders):
+        self.folder_selected.emit(folder.id)
+
+    def _button_for_category(self, category: str):
+
+        btn = self._btn_map.get(category)
+
+        if btn is None:
+
+            btn = self._folder_btn_by_key.get(category)
+
+        return btn
+
+    def set_category(self, category: str):
+
+        if category == self.current_category:
+
+            # Clicking the selected button toggles it off; keep it selected
+            btn = self._button_for_category(category)
+
+            if btn and not btn.isChecked():
+
+                btn.setChecked(True)
+
+            return
+
+        self.current_category = category
+
+        # Only the previously selected button needs restyling
+        for btn in self.static_buttons + self.folder_buttons:
+
+            if btn and btn.isChecked():
+
+                btn.setChecked(False)
 
-                if folder.id == folder_id and i < len(self.folder_buttons):
+        btn = self._button_for_category(category)
 
-                    self.folder_buttons[i].setChecked(True)
+        if btn:
 
-                    break
+            btn.setChecked(True)
 
         self.category_changed.emit(category)
 
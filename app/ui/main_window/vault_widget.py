@@ -5,7 +5,7 @@ from PySide6.QtWidgets import (
 
 )
 
-from PySide6.QtCore import Signal, QTimer, Qt, QFileSystemWatcher
+from PySide6.QtCore import Signal, Slot, QTimer, Qt, QFileSystemWatcher, QObject, QRunnable, QThreadPool, QMetaObject
 
 from app.core.vault import VaultManager, Credential, SecureNote, CreditCard, Folder
 
@@ -13,7 +13,11 @@ from app.ui.theme import get_theme
 
 from app.ui.main_window.sidebar import Sidebar
 
-from app.ui.main_window.item_list import CredentialsList
+from app.ui.main_window.item_list import (
+
+    CredentialsList, ITEM_TYPE_CREDENTIAL, ITEM_TYPE_NOTE, ITEM_TYPE_CARD
+
+)
 
 from app.ui.main_window.detail_panel import DetailPanel
 
@@ -31,40 +35,65 @@ from app.ui.settings_dialog import SettingsDialog
 
 from app.ui.gdrive_dialog import GoogleDriveDialog
 
+import logging
 import os
-from PySide6.QtCore import QThread
+from dataclasses import replace
+from functools import partial
 from app.ui.components.loading import LoadingOverlay
 
+logger = logging.getLogger(__name__)
 
-class DataLoadWorker(QThread):
+
+class DataLoadSignals(QObject):
     finished = Signal(tuple)
 
-    def __init__(self, vault: VaultManager, master_password: str = None):
+
+class DataLoadWorker(QRunnable):
+
+    def __init__(self, vault: VaultManager, master_password: str = None, signals: DataLoadSignals = None):
         super().__init__()
         self.vault = vault
         self.master_password = master_password
+        self.signals = signals
 
     def run(self):
         try:
             # Derive key if provided and needed
             if self.master_password:
                 # Unlock vault (verifies password and derives key)
-                # Running in QThread avoids freezing the UI
+                # Running on the thread pool avoids freezing the UI
                 self.vault.unlock(self.master_password)
                 
             folders = self.vault.get_all_folders()
-            credentials = self.vault.get_all_credentials()
-            secure_notes = self.vault.get_all_secure_notes()
-            credit_cards = self.vault.get_all_credit_cards()
-            self.finished.emit((folders, credentials, secure_notes, credit_cards))
+            credentials, secure_notes, credit_cards = self.vault.get_all_items()
+            self._emit((folders, credentials, secure_notes, credit_cards))
 
-        except Exception as e:
-            print(f"Error loading data in background: {e}")
-            self.finished.emit(([], [], [], []))
+        except Exception:
+            logger.exception("Error loading data in background")
+            self._emit(([], [], [], []))
+
+    def _emit(self, data):
+        try:
+            self.signals.finished.emit(data)
+        except RuntimeError:
+            pass  # vault widget was destroyed mid-load
 
 class VaultWidget(QWidget):
     lock_requested = Signal()
 
+    # Re-emits VaultManager change callbacks, which can fire on worker threads
+    vault_changed = Signal(str, int, str)
+
+    _YESNO = QMessageBox.Yes | QMessageBox.No
+
+    # Sidebar category -> item list filter; folders are handled separately
+    _FILTER_MAP = {
+        "all": ("all", None),
+        "favorites": ("favorites", None),
+        "secure_notes": ("secure_notes", None),
+        "credit_cards": ("credit_cards", None),
+    }
+
     def __init__(self, vault: VaultManager, parent=None, master_password: str = None):
 
         super().__init__(parent)
@@ -76,9 +105,40 @@ class VaultWidget(QWidget):
 
         self.current_category = "all"
 
+        # Last folder list fetched from the vault, reused by the note dialogs
+        self._folders = []
+
+        self._folder_name_by_id = {}
+
+        # (id, name, vault type, icon) of the folders last pushed to the UI
+        self._folders_signature = None
+
+        # Heavy dialogs are built on first use and reused afterwards
+        self._settings_dialog = None
+
+        self._gdrive_dialog = None
+
+        self._add_item_dialog = None
+
+        # Background loads report back through this GUI-thread object, so the
+        # result is delivered to on_data_loaded as a queued call
+        self._loading = False
+        self._own_write_stat = None
+        self._load_signals = DataLoadSignals(self)
+        self._load_signals.finished.connect(self.on_data_loaded)
+
         self.setup_ui()
 
-        QTimer.singleShot(50, self.load_data)
+        self._setup_dispatch()
+
+        # Item writes are applied to the list from the vault's change
+        # notifications; queued so they land after the handler that wrote
+        self.vault_changed.connect(self._on_vault_changed, Qt.QueuedConnection)
+
+        self.vault.on_change(self._on_vault_change_callback)
+
+        # Start loading as soon as control returns to the event loop
+        QMetaObject.invokeMethod(self, "load_data", Qt.QueuedConnection)
         
         # Setup file watcher for auto-reload
         self.watcher = QFileSystemWatcher(self)
@@ -90,17 +150,49 @@ class VaultWidget(QWidget):
         self._reload_timer = QTimer(self)
         self._reload_timer.setSingleShot(True)
         self._reload_timer.setInterval(500) # Wait 500ms after last change
-        self._reload_timer.timeout.connect(self.load_data)
+        self._reload_timer.timeout.connect(self._reload_from_disk)
+
+        # Coalesces item reloads requested by bursts of edits into one fetch
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._do_reload)
 
+    @Slot(str)
     def _on_db_file_changed(self, path):
         # Restart the timer on every change signal
         self._reload_timer.start()
 
+    def _db_stat(self):
+        try:
+            st = os.stat(self.vault.db_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _mark_own_write(self):
+        # Called after the write has committed, so this is the file as we left it.
+        # May run on a worker thread (e.g. a watchtower scan); a tuple store is safe
+        self._own_write_stat = self._db_stat()
+
+    @Slot()
+    def _reload_from_disk(self):
+        # Writes made through this window were already applied row by row;
+        # only a change from elsewhere (sync, another process) needs a full reload.
+        # If anything touched the file after our last write, its stat differs
+        own = self._own_write_stat
+        if own is not None and own == self._db_stat():
+            return
+        self.load_data()
+
+    @Slot()
     def load_data(self):
         # Prevent multiple simultaneous loads
-        if hasattr(self, 'worker') and self.worker.isRunning():
+        if self._loading:
             return
 
+        self._loading = True
+
         if hasattr(self, 'watcher') and self.watcher:
             self.watcher.blockSignals(True)
 
@@ -109,20 +201,20 @@ class VaultWidget(QWidget):
             self.loading_overlay.raise_()
         
         # Pass master_password to worker
-        self.worker = DataLoadWorker(self.vault, self.master_password)
-        self.worker.finished.connect(self.on_data_loaded)
-        self.worker.start()
+        QThreadPool.globalInstance().start(
+            DataLoadWorker(self.vault, self.master_password, self._load_signals))
         
         # Clear master password from memory reference after passing to thread
         self.master_password = None
 
+    @Slot(tuple)
     def on_data_loaded(self, data):
+        self._loading = False
         folders, credentials, secure_notes, credit_cards = data
         
         try:
             # Update Folders
-            self.sidebar.set_folders(folders)
-            self.detail_panel.set_available_folders(folders)
+            self._apply_folders(folders)
             
             # Update Items using Batch Loading to avoid UI freeze
             self.credentials_list.clear_items()
@@ -143,13 +235,14 @@ class VaultWidget(QWidget):
             if hasattr(self, 'watchtower_view'):
                 self.watchtower_view.start_initial_scan()
             
-        except Exception as e:
-            print(f"Error updating UI with loaded data: {e}")
+        except Exception:
+            logger.exception("Error updating UI with loaded data")
             if hasattr(self, 'loading_overlay'):
                 self.loading_overlay.hide()
             if hasattr(self, 'watcher') and self.watcher:
                 self.watcher.blockSignals(False)
 
+    @Slot()
     def _process_batch(self):
         try:
             BATCH_SIZE = 50
@@ -174,8 +267,8 @@ class VaultWidget(QWidget):
             if not self._pending_items:
                 self._finish_loading()
                 
-        except Exception as e:
-            print(f"Error in batch processing: {e}")
+        except Exception:
+            logger.exception("Error in batch processing")
             self._finish_loading()
 
     def _finish_loading(self):
@@ -257,6 +350,96 @@ class VaultWidget(QWidget):
     def set_category(self, category: str):
         self.sidebar.set_category(category)
 
+    def _setup_dispatch(self):
+
+        # Per item type handlers, looked up by type(item) in the item slots
+        panel = self.detail_panel
+
+        vault = self.vault
+
+        self._show_dispatch = {
+            Credential: panel.show_credential,
+            SecureNote: panel.show_secure_note,
+            CreditCard: panel.show_credit_card,
+        }
+
+        # type -> toggle favourite, returning the new state
+        self._favorite_dispatch = {
+            Credential: vault.toggle_favorite,
+            SecureNote: vault.toggle_secure_note_favorite,
+            CreditCard: vault.toggle_credit_card_favorite,
+        }
+
+        # type -> (edit dialog factory, update, fetch by id)
+        self._edit_dispatch = {
+            Credential: (partial(CredentialDialog, parent=self), vault.update_credential, vault.get_credential),
+            SecureNote: (self._secure_note_dialog, vault.update_secure_note, vault.get_secure_note),
+            CreditCard: (partial(CreditCardDialog, parent=self), vault.update_credit_card, vault.get_credit_card),
+        }
+
+        # change kind -> (list item type, fetch by id)
+        self._change_dispatch = {
+            "credential": (ITEM_TYPE_CREDENTIAL, vault.get_credential),
+            "secure_note": (ITEM_TYPE_NOTE, vault.get_secure_note),
+            "credit_card": (ITEM_TYPE_CARD, vault.get_credit_card),
+        }
+
+        # type -> (label, name attribute, delete)
+        self._delete_dispatch = {
+            Credential: ("credential", "domain", vault.delete_credential),
+            SecureNote: ("secure note", "title", vault.delete_secure_note),
+            CreditCard: ("credit card", "title", vault.delete_credit_card),
+        }
+
+    def _on_vault_change_callback(self, kind: str, item_id: int, op: str):
+
+        self._mark_own_write()
+
+        self.vault_changed.emit(kind, item_id, op)
+
+    def release_vault(self):
+
+        # Stop listening for vault changes once this widget is replaced
+        self.vault.remove_change_callback(self._on_vault_change_callback)
+
+    @Slot(str, int, str)
+    def _on_vault_changed(self, kind: str, item_id: int, op: str):
+
+        entry = self._change_dispatch.get(kind)
+
+        if entry is None:
+
+            return
+
+        item_type, fetch = entry
+
+        try:
+
+            if op == "bulk":
+
+                self.load_credentials()
+
+            elif op == "removed":
+
+                self.credentials_list.remove_item(item_type, item_id)
+
+            elif op == "added":
+
+                self._insert_item(fetch(item_id))
+
+            else:
+
+                self._refresh_item(fetch(item_id))
+
+        except Exception:
+
+            logger.exception("Error applying vault change")
+
+    def _secure_note_dialog(self, item=None):
+
+        return SecureNoteDialog(item, folders=self._folders, parent=self)
+
+    @Slot()
     def toggle_sidebar(self):
 
         self.sidebar_visible = not self.sidebar_visible
@@ -269,32 +452,51 @@ class VaultWidget(QWidget):
 
         try:
 
-            folders = self.vault.get_all_folders()
+            self._apply_folders(self.vault.get_all_folders())
 
-            self.sidebar.set_folders(folders)
+        except Exception:
 
-            self.detail_panel.set_available_folders(folders)
+            logger.exception("Error loading folders")
 
-        except Exception as e:
+    def _apply_folders(self, folders):
+
+        self._folders = folders
+
+        # Only rebuild the sidebar and folder pickers when something they
+        # show actually changed
+        signature = tuple((f.id, f.name, f.vault_type, f.icon) for f in folders)
 
-            print(f"Error loading folders: {e}")
+        if signature == self._folders_signature:
+
+            return
+
+        self._folders_signature = signature
+
+        self._folder_name_by_id = {f.id: f.name for f in folders}
+
+        self.sidebar.set_folders(folders)
+
+        self.detail_panel.set_available_folders(folders)
 
     def load_credentials(self):
 
-        try:
+        # Restarting the timer folds repeated requests into a single reload
+        self._refresh_timer.start()
 
-            credentials = self.vault.get_all_credentials()
+    @Slot()
+    def _do_reload(self):
 
-            secure_notes = self.vault.get_all_secure_notes()
+        try:
 
-            credit_cards = self.vault.get_all_credit_cards()
+            credentials, secure_notes, credit_cards = self.vault.get_all_items()
 
             self.credentials_list.set_all_items(credentials, secure_notes, credit_cards)
 
-        except Exception as e:
+        except Exception:
 
-            print(f"Error loading items: {e}")
+            logger.exception("Error loading items")
 
+    @Slot(str)
     def on_category_changed(self, category: str):
         self.current_category = category
         
@@ -308,37 +510,28 @@ class VaultWidget(QWidget):
             
         self.content_stack.setCurrentIndex(0)
 
-        if category == "all":
-            self.credentials_list.set_filter("all")
-        elif category == "favorites":
-            self.credentials_list.set_filter("favorites")
-        elif category == "secure_notes":
-            self.credentials_list.set_filter("secure_notes")
-        elif category == "credit_cards":
-            self.credentials_list.set_filter("credit_cards")
+        filter_args = self._FILTER_MAP.get(category)
+        if filter_args is not None:
+            self.credentials_list.set_filter(*filter_args)
         elif category.startswith("folder_"):
             try:
-                folder_id = int(category.split("_")[1])
+                folder_id = int(category[7:])
                 self.credentials_list.set_filter("folder", folder_id)
-            except (IndexError, ValueError):
+            except ValueError:
                 self.credentials_list.set_filter("all")
         
         self.detail_panel.show_empty_state()
 
+    @Slot(object)
     def on_credential_selected(self, item):
 
-        if isinstance(item, Credential):
+        show = self._show_dispatch.get(type(item))
 
-            self.detail_panel.show_credential(item)
+        if show is not None:
 
-        elif isinstance(item, SecureNote):
-
-            self.detail_panel.show_secure_note(item)
-
-        elif isinstance(item, CreditCard):
-
-            self.detail_panel.show_credit_card(item)
+            show(item)
 
+    @Slot()
     def add_folder(self):
 
         dialog = FolderDialog(self, "Create Folder")
@@ -361,9 +554,9 @@ class VaultWidget(QWidget):
 
                     self.vault.create_folder(name, vault_type=vault_type)
 
-                    self.load_folders()
+                    self._mark_own_write()
 
-                    self.sidebar.personal_folders_container.setVisible(True)
+                    self.load_folders()
 
                     self.show_status(f"Folder '{name}' created")
 
@@ -371,6 +564,7 @@ class VaultWidget(QWidget):
 
                     QMessageBox.critical(self, "Error", f"Failed to create folder: {e}")
 
+    @Slot(object)
     def on_folder_edit(self, folder: Folder):
 
         dialog = FolderDialog(self, "Rename Folder", folder.name)
@@ -385,6 +579,8 @@ class VaultWidget(QWidget):
 
                     if self.vault.update_folder(folder.id, name):
 
+                        self._mark_own_write()
+
                         self.load_folders()
 
                         self.show_status(f"Folder renamed to '{name}'")
@@ -393,6 +589,7 @@ class VaultWidget(QWidget):
 
                     QMessageBox.critical(self, "Error", f"Failed to rename folder: {e}")
 
+    @Slot(object)
     def on_folder_delete(self, folder: Folder):
 
         reply = QMessageBox.question(
@@ -403,7 +600,7 @@ class VaultWidget(QWidget):
 
             f"Are you sure you want to delete folder '{folder.name}'?\nCredentials inside will not be deleted but will be moved to 'All Items'.",
 
-            QMessageBox.Yes | QMessageBox.No,
+            self._YESNO,
 
             QMessageBox.No
 
@@ -415,6 +612,8 @@ class VaultWidget(QWidget):
 
                 if self.vault.delete_folder(folder.id):
 
+                    self._mark_own_write()
+
                     self.load_folders()
 
                     self.show_status(f"Folder '{folder.name}' deleted")
@@ -427,6 +626,7 @@ class VaultWidget(QWidget):
 
                 QMessageBox.critical(self, "Error", f"Failed to delete folder: {e}")
 
+    @Slot(object, object)
     def move_credential_to_folder(self, credential, folder_id):
 
         try:
@@ -439,15 +639,13 @@ class VaultWidget(QWidget):
 
                     self.detail_panel.show_credential(updated_cred)
 
-                    self.load_credentials()
-
                     if folder_id is None:
 
                         self.show_status("Removed from folder")
 
                     else:
 
-                        folder_name = next((f.name for f in self.vault.get_all_folders() if f.id == folder_id), "folder")
+                        folder_name = self._folder_name_by_id.get(folder_id, "folder")
 
                         self.show_status(f"Moved to {folder_name}")
 
@@ -455,76 +653,68 @@ class VaultWidget(QWidget):
 
             QMessageBox.critical(self, "Error", f"Failed to move credential: {e}")
 
+    @Slot(object)
     def toggle_favorite(self, item):
 
-        try:
-
-            if isinstance(item, Credential):
-
-                self.vault.toggle_credential_favorite(item.id)
-
-                updated = next((c for c in self.vault.get_all_credentials() if c.id == item.id), None)
-
-                if updated:
-
-                    self.detail_panel.show_credential(updated)
-
-            elif isinstance(item, SecureNote):
-
-                self.vault.toggle_secure_note_favorite(item.id)
-
-                updated = next((n for n in self.vault.get_all_secure_notes() if n.id == item.id), None)
-
-                if updated:
-
-                    self.detail_panel.show_secure_note(updated)
+        toggle = self._favorite_dispatch.get(type(item))
 
-            elif isinstance(item, CreditCard):
+        if toggle is None:
 
-                self.vault.toggle_credit_card_favorite(item.id)
+            return
 
-                updated = next((c for c in self.vault.get_all_credit_cards() if c.id == item.id), None)
+        try:
 
-                if updated:
+            # The toggle returns the new state, so the detail view is updated
+            # from the item in hand; the list row follows the change notification
+            is_favorite = toggle(item.id)
 
-                    self.detail_panel.show_credit_card(updated)
+            self._show_dispatch[type(item)](replace(item, is_favorite=is_favorite))
 
-            self.load_credentials()
-
-        except Exception as e:
+        except Exception:
 
-            print(f"Error toggling favorite: {e}")
+            logger.exception("Error toggling favorite")
 
+    @Slot()
     def on_settings_clicked(self):
 
-        dialog = SettingsDialog(self)
+        if self._settings_dialog is None:
 
-        dialog.exec()
+            self._settings_dialog = SettingsDialog(self)
 
+        self._settings_dialog.exec()
+
+    @Slot()
     def on_google_drive_clicked(self):
 
-        dialog = GoogleDriveDialog(self)
+        if self._gdrive_dialog is None:
+
+            self._gdrive_dialog = GoogleDriveDialog(self)
 
-        dialog.connection_successful.connect(self._on_gdrive_connected)
+            self._gdrive_dialog.connection_successful.connect(self._on_gdrive_connected)
 
-        dialog.exec()
+        self._gdrive_dialog.exec()
 
+    @Slot()
     def _on_gdrive_connected(self):
 
         self.show_status("Connected to Google Drive")
 
+    @Slot()
     def add_credential(self):
 
-        dialog = AddNewItemDialog(parent=self)
+        if self._add_item_dialog is None:
+
+            self._add_item_dialog = AddNewItemDialog(parent=self)
 
-        dialog.login_selected.connect(self._add_login)
+            self._add_item_dialog.login_selected.connect(self._add_login)
 
-        dialog.credit_card_selected.connect(self._add_credit_card)
+            self._add_item_dialog.credit_card_selected.connect(self._add_credit_card)
 
-        dialog.secure_note_selected.connect(self._add_secure_note)
+            self._add_item_dialog.secure_note_selected.connect(self._add_secure_note)
 
-        dialog.exec()
+        self._add_item_dialog.exec()
 
+    @Slot()
     def _add_login(self):
 
         dialog = CredentialDialog(parent=self)
@@ -538,9 +728,8 @@ class VaultWidget(QWidget):
                 add_data = {k: v for k, v in data.items() if k not in ('clear_totp', 'clear_backup')}
 
                 self.vault.add_credential(**add_data)
-
-                self.load_credentials()
     
+    @Slot(str)
     def _use_generated_password(self, password):
         dialog = CredentialDialog(parent=self)
         dialog.password_input.setText(password)
@@ -550,11 +739,11 @@ class VaultWidget(QWidget):
             if data['domain'] and data['username'] and data['password']:
                 add_data = {k: v for k, v in data.items() if k not in ('clear_totp', 'clear_backup')}
                 self.vault.add_credential(**add_data)
-                self.load_credentials()
                 
                 # Switch to vault view to show the new credential
                 self.set_category("all")
 
+    @Slot()
     def _add_credit_card(self):
 
         dialog = CreditCardDialog(parent=self)
@@ -567,13 +756,10 @@ class VaultWidget(QWidget):
 
                 self.vault.add_credit_card(**data)
 
-                self.load_credentials()
-
+    @Slot()
     def _add_secure_note(self):
 
-        folders = self.vault.get_all_folders()
-
-        dialog = SecureNoteDialog(folders=folders, parent=self)
+        dialog = self._secure_note_dialog()
 
         if dialog.exec():
 
@@ -583,89 +769,43 @@ class VaultWidget(QWidget):
 
                 self.vault.add_secure_note(**data)
 
-                self.load_credentials()
-
+    @Slot(object)
     def edit_credential(self, item):
 
-        if isinstance(item, Credential):
-
-            dialog = CredentialDialog(item, parent=self)
-
-            if dialog.exec():
-
-                data = dialog.get_data()
+        entry = self._edit_dispatch.get(type(item))
 
-                self.vault.update_credential(item.id, **data)
+        if entry is None:
 
-                self.load_credentials()
-
-                updated = next((c for c in self.vault.get_all_credentials() if c.id == item.id), None)
-
-                if updated:
-
-                    self.detail_panel.show_credential(updated)
-
-        elif isinstance(item, SecureNote):
-
-            folders = self.vault.get_all_folders()
-
-            dialog = SecureNoteDialog(item, folders=folders, parent=self)
-
-            if dialog.exec():
-
-                data = dialog.get_data()
-
-                self.vault.update_secure_note(item.id, **data)
-
-                self.load_credentials()
-
-                updated = next((n for n in self.vault.get_all_secure_notes() if n.id == item.id), None)
-
-                if updated:
-
-                    self.detail_panel.show_secure_note(updated)
-
-        elif isinstance(item, CreditCard):
+            return
 
-            dialog = CreditCardDialog(item, parent=self)
+        make_dialog, update, fetch = entry
 
-            if dialog.exec():
+        dialog = make_dialog(item)
 
-                data = dialog.get_data()
+        if dialog.exec():
 
-                self.vault.update_credit_card(item.id, **data)
+            data = dialog.get_data()
 
-                self.load_credentials()
+            update(item.id, **data)
 
-                updated = next((c for c in self.vault.get_all_credit_cards() if c.id == item.id), None)
+            updated = fetch(item.id)
 
-                if updated:
+            if updated:
 
-                    self.detail_panel.show_credit_card(updated)
+                self._show_dispatch[type(updated)](updated)
 
+    @Slot(object)
     def delete_credential(self, item):
 
-        if isinstance(item, Credential):
-
-            name = item.domain
-
-            item_type = "credential"
-
-        elif isinstance(item, SecureNote):
+        entry = self._delete_dispatch.get(type(item))
 
-            name = item.title
+        if entry is None:
 
-            item_type = "secure note"
-
-        elif isinstance(item, CreditCard):
+            return
 
-            name = item.title
+        item_type, name_attr, delete = entry
 
-            item_type = "credit card"
-
-        else:
-
-            return
+        name = getattr(item, name_attr)
 
         reply = QMessageBox.question(
 
@@ -675,7 +815,7 @@ class VaultWidget(QWidget):
 
             f"Are you sure you want to delete the {item_type}?\n\n{name}\n\nThis action cannot be undone.",
 
-            QMessageBox.Yes | QMessageBox.No,
+            self._YESNO,
 
             QMessageBox.No
 
@@ -683,22 +823,29 @@ class VaultWidget(QWidget):
 
         if reply == QMessageBox.Yes:
 
-            if isinstance(item, Credential):
+            delete(item.id)
 
-                self.vault.delete_credential(item.id)
+            self.detail_panel.show_empty_state()
 
-            elif isinstance(item, SecureNote):
+    def _insert_item(self, item):
 
-                self.vault.delete_secure_note(item.id)
+        # Add one new row; fall back to a full reload if it could not be read back
+        if item is None:
 
-            elif isinstance(item, CreditCard):
+            self.load_credentials()
 
-                self.vault.delete_credit_card(item.id)
+        else:
 
-            self.load_credentials()
+            self.credentials_list.add_item(item)
 
-            self.detail_panel.show_empty_state()
+    def _refresh_item(self, item):
+
+        # Rewrite one row in place; fall back to a full reload if it is missing
+        if item is None or not self.credentials_list.update_item(item):
+
+            self.load_credentials()
 
+    @Slot(str)
     def show_status(self, message: str):
 
         pass
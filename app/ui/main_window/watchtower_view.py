@@ -1,44 +1,119 @@
 
+from functools import lru_cache
 from typing import List, Optional, Dict, Tuple
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, 
-    QScrollArea, QSizePolicy, QProgressBar
+    QScrollArea, QSizePolicy, QProgressBar, QApplication
 )
-from PySide6.QtCore import Qt, QTimer, Signal, QThread, QRectF, Property, QPoint, QUrl
-from PySide6.QtGui import QColor, QPainter, QPen, QFont, QIcon, QCursor, QPaintEvent, QDesktopServices
+from PySide6.QtCore import Qt, QTimer, Signal, QThread, QRectF, Property, QPoint, QUrl, QEvent, QPropertyAnimation, QEasingCurve
+from PySide6.QtGui import QColor, QPainter, QPen, QFont, QIcon, QCursor, QPaintEvent, QDesktopServices, QPixmap
 
 from app.core.vault import VaultManager, Credential
-from app.core.watchtower_service import WatchtowerService
+from app.core.watchtower_service import WatchtowerService, ScanResults
 from app.ui.theme import get_theme
-from app.ui.ui_utils import load_svg_icon
+from app.ui.ui_utils import load_svg_qicon
 from app.ui.components.loading import LoadingOverlay
 
+@lru_cache(maxsize=1)
+def _score_font() -> QFont:
+    # Built on first paint, once a QApplication exists
+    return QFont("Segoe UI", 16, QFont.Bold)
+
+@lru_cache(maxsize=32)
+def _color(value: str) -> QColor:
+    # Theme colours are hex strings; each one is parsed once
+    return QColor(value)
+
+# Rendered domain-initial tiles, keyed by letter, DPR and theme colours
+_icon_atlas: Dict[Tuple[str, float, str, str], QPixmap] = {}
+
+def _initial_icon(letter: str, dpr: float) -> QPixmap:
+    theme = get_theme()
+    key = (letter, dpr, theme.colors.muted, theme.colors.foreground)
+    pixmap = _icon_atlas.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(round(40 * dpr), round(40 * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(_color(theme.colors.muted))
+        painter.drawRoundedRect(QRectF(0, 0, 40, 40), 8, 8)
+        font = QFont(QApplication.font())
+        font.setPixelSize(16)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(_color(theme.colors.foreground))
+        painter.drawText(QRectF(0, 0, 40, 40), Qt.AlignCenter, letter)
+        painter.end()
+        _icon_atlas[key] = pixmap
+    return pixmap
+
 class CircularProgress(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.value = 0
+        self._value = 0.0
         self.setFixedSize(70, 70)
+        self._track_pixmap = None
+        self._track_key = None
+        self._animation = QPropertyAnimation(self, b"value", self)
+        self._animation.setDuration(600)
+        self._animation.setEasingCurve(QEasingCurve.OutCubic)
+
+    def _get_value(self):
+        return self._value
 
     def set_value(self, value):
-        self.value = value
+        # update() lets Qt coalesce repaints; never repaint() from here
+        self._value = value
         self.update()
 
+    value = Property(float, _get_value, set_value)
+
+    def animate_to(self, value):
+        self._animation.stop()
+        self._animation.setStartValue(float(self._value))
+        self._animation.setEndValue(float(value))
+        self._animation.start()
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.DevicePixelRatioChange:
+            self._track_pixmap = None
+        super().changeEvent(event)
+
+    def _track(self, color):
+        # The background ring never changes, so it is drawn once per DPR/colour
+        dpr = self.devicePixelRatioF()
+        key = (dpr, color)
+        if self._track_pixmap is None or self._track_key != key:
+            pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            pen = QPen(QColor(color), 8)
+            pen.setCapStyle(Qt.RoundCap)
+            painter.setPen(pen)
+            painter.drawArc(QRectF(4, 4, 62, 62), 0, 360 * 16)
+            painter.end()
+            self._track_pixmap = pixmap
+            self._track_key = key
+        return self._track_pixmap
+
     def paintEvent(self, event):
         theme = get_theme()
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._track(theme.colors.muted))
         painter.setRenderHint(QPainter.Antialiasing)
         rect = QRectF(4, 4, 62, 62)
-        pen = QPen(QColor(theme.colors.muted), 8)
+        pen = QPen(_color(theme.colors.primary), 8)
         pen.setCapStyle(Qt.RoundCap)
         painter.setPen(pen)
-        painter.drawArc(rect, 0, 360 * 16)
-        pen.setColor(QColor(theme.colors.primary))
-        painter.setPen(pen)
         span_angle = -self._val_to_angle(self.value) * 16
         painter.drawArc(rect, 90 * 16, span_angle)
-        painter.setPen(QColor(theme.colors.foreground))
-        font = QFont("Segoe UI", 16, QFont.Bold)
-        painter.setFont(font)
+        painter.setPen(_color(theme.colors.foreground))
+        painter.setFont(_score_font())
         painter.drawText(rect, Qt.AlignCenter, str(int(self.value)))
 
     def _val_to_angle(self, val):
@@ -46,6 +121,32 @@ class CircularProgress(QWidget):
 
 
 
+class HealthSummary(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedHeight(120)
+        self._cards = []
+        self.cards_layout = QHBoxLayout(self)
+        self.cards_layout.setContentsMargins(0, 0, 0, 0)
+        self.cards_layout.setSpacing(20)
+
+    def add_card(self, layout):
+        # Cards are plain layouts; their backgrounds are painted here in one pass
+        self.cards_layout.addLayout(layout, 1)
+        self._cards.append(layout)
+
+    def paintEvent(self, event):
+        theme = get_theme()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(_color(theme.colors.border), 1))
+        painter.setBrush(_color(theme.colors.card))
+        for layout in self._cards:
+            rect = QRectF(layout.geometry()).adjusted(0.5, 0.5, -0.5, -0.5)
+            painter.drawRoundedRect(rect, 11.5, 11.5)
+
+
+
 class NavTab(QFrame):
     clicked = Signal()
     def __init__(self, title, count=None, parent=None):
@@ -54,33 +155,40 @@ class NavTab(QFrame):
         self.is_active = False
         self.count = count
         theme = get_theme()
+        # Both states are described once; set_active only flips the "active" property
+        self.setObjectName("NavTab")
+        self.setStyleSheet(f"""
+            #NavTab {{ border-bottom: none; }}
+            #NavTabTitle {{ font-weight: 600; font-size: 13px; color: {theme.colors.muted_foreground}; border-bottom: 2px solid transparent; padding-bottom: 4px; }}
+            #NavTabTitle[active="true"] {{ color: {theme.colors.primary}; border-bottom: 2px solid {theme.colors.primary}; }}
+            #NavTabCount {{ background-color: {theme.colors.muted}; color: {theme.colors.muted_foreground}; border-radius: 4px; padding: 2px 6px; font-size: 11px; font-weight: bold; }}
+            #NavTabCount[active="true"] {{ background-color: {theme.colors.destructive}; color: {theme.colors.destructive_foreground}; }}
+        """)
         layout = QHBoxLayout(self)
         layout.setContentsMargins(12, 12, 12, 12)
         layout.setSpacing(8)
         self.lbl_title = QLabel(title)
-        self.lbl_title.setStyleSheet(f"font-weight: 600; font-size: 13px; color: {theme.colors.muted_foreground};")
+        self.lbl_title.setObjectName("NavTabTitle")
         layout.addWidget(self.lbl_title)
         if count is not None:
             self.lbl_count = QLabel(str(count))
-            self.lbl_count.setStyleSheet(f"background-color: {theme.colors.muted}; color: {theme.colors.muted_foreground}; border-radius: 4px; padding: 2px 6px; font-size: 11px; font-weight: bold;")
+            self.lbl_count.setObjectName("NavTabCount")
             layout.addWidget(self.lbl_count)
         layout.addStretch()
         self.update_style()
         
     def update_style(self):
-        theme = get_theme()
-        if self.is_active:
-            self.lbl_title.setStyleSheet(f"font-weight: 600; font-size: 13px; color: {theme.colors.primary}; border-bottom: 2px solid {theme.colors.primary}; padding-bottom: 4px;")
-            self.setStyleSheet("border-bottom: none;")
-            if hasattr(self, 'lbl_count'):
-                self.lbl_count.setStyleSheet(f"background-color: {theme.colors.destructive}; color: {theme.colors.destructive_foreground}; border-radius: 4px; padding: 2px 6px; font-size: 11px; font-weight: bold;")
-        else:
-            self.lbl_title.setStyleSheet(f"font-weight: 600; font-size: 13px; color: {theme.colors.muted_foreground}; border-bottom: 2px solid transparent; padding-bottom: 4px;")
-            self.setStyleSheet("border-bottom: none;")
-            if hasattr(self, 'lbl_count'):
-                self.lbl_count.setStyleSheet(f"background-color: {theme.colors.muted}; color: {theme.colors.muted_foreground}; border-radius: 4px; padding: 2px 6px; font-size: 11px; font-weight: bold;")
+        labels = [self.lbl_title]
+        if hasattr(self, 'lbl_count'):
+            labels.append(self.lbl_count)
+        for lbl in labels:
+            lbl.setProperty("active", self.is_active)
+            lbl.style().unpolish(lbl)
+            lbl.style().polish(lbl)
                 
     def set_active(self, active):
+        if active == self.is_active:
+            return
         self.is_active = active
         self.update_style()
     def set_count(self, count):
@@ -92,67 +200,92 @@ class NavTab(QFrame):
 class IncidentItem(QFrame):
     def __init__(self, credential, issue_type="LEAKED", count=None):
         super().__init__()
-        self.credential = credential
+        self.credential = None
+        self.issue_type = None
         theme = get_theme()
         self.setFixedHeight(72)
-        self.setStyleSheet(f"QFrame {{ background-color: {theme.colors.card}; border-radius: 8px; }}")
         layout = QHBoxLayout(self)
         layout.setContentsMargins(16, 0, 16, 0)
         layout.setSpacing(16)
         
-        icon_lbl = QLabel()
-        icon_lbl.setFixedSize(40, 40)
-        icon_lbl.setStyleSheet(f"background-color: {theme.colors.muted}; border-radius: 8px; color: {theme.colors.foreground}; font-weight: bold; font-size: 16px; qproperty-alignment: AlignCenter;")
-        icon_lbl.setText(credential.domain[:1].upper() if credential.domain else "?")
-        layout.addWidget(icon_lbl)
+        self.icon_lbl = QLabel()
+        self.icon_lbl.setFixedSize(40, 40)
+        self.icon_lbl.setStyleSheet("background: transparent;")
+        layout.addWidget(self.icon_lbl)
         
         info_layout = QVBoxLayout()
         info_layout.setSpacing(4)
         info_layout.setAlignment(Qt.AlignVCenter)
         top_line = QHBoxLayout()
         top_line.setSpacing(8)
-        name_lbl = QLabel(credential.domain)
-        name_lbl.setStyleSheet(f"color: {theme.colors.foreground}; font-weight: bold; font-size: 14px; background: transparent;")
-        top_line.addWidget(name_lbl)
+        self.name_lbl = QLabel()
+        self.name_lbl.setStyleSheet(f"color: {theme.colors.foreground}; font-weight: bold; font-size: 14px; background: transparent;")
+        top_line.addWidget(self.name_lbl)
         
-        tag_color = theme.colors.destructive if issue_type in ["LEAKED", "WEAK"] else theme.colors.warning
-        tag_text = issue_type if not count else f"{issue_type}"
-        icon_char = "!"
-        if issue_type == "REUSED": icon_char = "⇄"
-        tag = QLabel(f"  {icon_char} {tag_text}  ")
-        tag.setStyleSheet(f"background-color: {tag_color}20; color: {tag_color}; border-radius: 4px; font-size: 10px; font-weight: bold; padding: 3px 6px;")
-        top_line.addWidget(tag)
+        self.tag = QLabel()
+        top_line.addWidget(self.tag)
         top_line.addStretch()
         info_layout.addLayout(top_line)
         
+        self.detail_lbl = QLabel()
+        self.detail_lbl.setStyleSheet(f"color: {theme.colors.muted_foreground}; font-size: 13px; background: transparent;")
+        info_layout.addWidget(self.detail_lbl)
+        layout.addLayout(info_layout)
+        
+        layout.addStretch()
+        self.btn = QPushButton("Update Password")
+        self.btn.setCursor(Qt.PointingHandCursor)
+        self.btn.setStyleSheet(f"QPushButton {{ background-color: {theme.colors.primary}; color: {theme.colors.primary_foreground}; border: none; border-radius: 6px; padding: 8px 16px; font-size: 13px; font-weight: 600; }} QPushButton:hover {{ background-color: {theme.colors.ring}; }}")
+        self.btn.clicked.connect(self.open_url)
+        layout.addWidget(self.btn)
+        
+        self.bind(credential, issue_type)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(_color(get_theme().colors.card))
+        painter.drawRoundedRect(QRectF(self.rect()), 8, 8)
+
+    def bind(self, credential, issue_type="LEAKED"):
+        self.credential = credential
+        domain = credential.domain
+        if not domain:
+            self._url = None
+        elif not domain.startswith("http"):
+            self._url = QUrl("https://" + domain)
+        else:
+            self._url = QUrl(domain)
+        letter = credential.domain[:1].upper() if credential.domain else "?"
+        self.icon_lbl.setPixmap(_initial_icon(letter, self.devicePixelRatioF()))
+        self.name_lbl.setText(credential.domain)
+        
         subtext = f"{credential.username}"
         if issue_type == "WEAK": subtext += " • Password is too short"
         elif issue_type == "REUSED": subtext += " • Shared with other sites"
         elif issue_type == "LEAKED": subtext += " • Found in data breach"
-        detail_lbl = QLabel(subtext)
-        detail_lbl.setStyleSheet(f"color: {theme.colors.muted_foreground}; font-size: 13px; background: transparent;")
-        info_layout.addWidget(detail_lbl)
-        layout.addLayout(info_layout)
+        self.detail_lbl.setText(subtext)
         
-        layout.addStretch()
-        btn = QPushButton("Update Password")
-        btn.setCursor(Qt.PointingHandCursor)
-        btn.setStyleSheet(f"QPushButton {{ background-color: {theme.colors.primary}; color: {theme.colors.primary_foreground}; border: none; border-radius: 6px; padding: 8px 16px; font-size: 13px; font-weight: 600; }} QPushButton:hover {{ background-color: {theme.colors.ring}; }}")
-        btn.clicked.connect(self.open_url)
-        layout.addWidget(btn)
+        # Only the tag's colour depends on the issue type, so restyle it on change
+        if issue_type == self.issue_type:
+            return
+        self.issue_type = issue_type
+        theme = get_theme()
+        tag_color = theme.colors.destructive if issue_type in ["LEAKED", "WEAK"] else theme.colors.warning
+        icon_char = "!"
+        if issue_type == "REUSED": icon_char = "⇄"
+        self.tag.setText(f"  {icon_char} {issue_type}  ")
+        self.tag.setStyleSheet(f"background-color: {tag_color}20; color: {tag_color}; border-radius: 4px; font-size: 10px; font-weight: bold; padding: 3px 6px;")
 
     def open_url(self):
-        domain = self.credential.domain
-        if not domain:
+        if self._url is None:
              return
-        if not domain.startswith("http"):
-             url = "https://" + domain
-        else:
-             url = domain
-        QDesktopServices.openUrl(QUrl(url))
+        # Opening can block on slow desktops, so let the click return first
+        QTimer.singleShot(0, lambda url=self._url: QDesktopServices.openUrl(url))
 
 class WatchtowerWorker(QThread):
-    finished = Signal(dict)
+    scan_finished = Signal(object)
     
     def __init__(self, service, network_scan):
         super().__init__()
@@ -162,10 +295,10 @@ class WatchtowerWorker(QThread):
     def run(self):
         try:
             results = self.service.scan_vault(self.network_scan)
-            self.finished.emit(results)
+            self.scan_finished.emit(results)
         except Exception as e:
             print(f"Watchtower scan error: {e}")
-            self.finished.emit({})
+            self.scan_finished.emit(None)
 
 class WatchtowerView(QWidget):
     def __init__(self, vault_manager: VaultManager):
@@ -175,9 +308,13 @@ class WatchtowerView(QWidget):
         
         self.active_category = "action_required"
         self.expanded_incidents = False
-        self.scan_results = {
-            'leaked': [], 'reused': [], 'weak': [], 'score': 0, 'total_count': 0, 'avg_age_days': 0, '2fa_count': 0
-        }
+        self._item_pool: List[IncidentItem] = []
+        self._items_by_category: Dict[str, List[Tuple[Credential, str]]] = {}
+        self._rendered_for = None
+        self.scan_results = ScanResults()
+        self.scan_worker = None
+        # Scan requested while another was running: None, or its network flag
+        self._pending_scan = None
         
         self.setup_ui()
         # Initial fast load (local only) deferred until explicitly called
@@ -223,11 +360,11 @@ class WatchtowerView(QWidget):
         title_row.addStretch()
         
         btn_sort = QPushButton("  Sort by Severity")
-        btn_sort.setIcon(QIcon(load_svg_icon("filter", 16, theme.colors.muted_foreground)))
+        btn_sort.setIcon(load_svg_qicon("filter", 16, theme.colors.muted_foreground))
         btn_sort.setStyleSheet(f"QPushButton {{ background-color: {theme.colors.card}; color: {theme.colors.foreground}; border: none; border-radius: 6px; padding: 10px 16px; font-weight: 600; font-size: 13px; }} QPushButton:hover {{ background-color: {theme.colors.muted}; }}")
         
         self.btn_scan = QPushButton("  Scan Now")
-        self.btn_scan.setIcon(QIcon(load_svg_icon("refresh", 16, theme.colors.primary_foreground)))
+        self.btn_scan.setIcon(load_svg_qicon("refresh", 16, theme.colors.primary_foreground))
         self.btn_scan.setStyleSheet(f"QPushButton {{ background-color: {theme.colors.primary}; color: {theme.colors.primary_foreground}; border: none; border-radius: 6px; padding: 10px 20px; font-weight: 600; font-size: 13px; }} QPushButton:hover {{ background-color: {theme.colors.ring}; }}")
         self.btn_scan.clicked.connect(lambda: self.run_scan(network_scan=True))
         
@@ -272,6 +409,11 @@ class WatchtowerView(QWidget):
         self.items_container = QVBoxLayout()
         self.items_container.setSpacing(12)
         scroll_layout.addLayout(self.items_container)
+        self.lbl_no_incidents = QLabel("No incidents found. Good job!")
+        self.lbl_no_incidents.setStyleSheet(f"color: {theme.colors.muted_foreground}; font-size: 14px; padding: 20px;")
+        self.lbl_no_incidents.setAlignment(Qt.AlignCenter)
+        self.lbl_no_incidents.hide()
+        scroll_layout.addWidget(self.lbl_no_incidents)
         
         self.btn_show_more = QPushButton("Show more incidents...")
         self.btn_show_more.setStyleSheet(f"QPushButton {{ background-color: {theme.colors.card}; color: {theme.colors.primary}; border: none; border-radius: 20px; padding: 10px 24px; font-weight: 600; font-size: 13px; }} QPushButton:hover {{ background-color: {theme.colors.muted}; }}")
@@ -289,36 +431,33 @@ class WatchtowerView(QWidget):
         lbl_health.setStyleSheet(f"color: {theme.colors.muted_foreground}; font-size: 12px; font-weight: bold; letter-spacing: 1px;")
         scroll_layout.addWidget(lbl_health)
         
-        cards_layout = QHBoxLayout()
-        cards_layout.setSpacing(20)
+        # Card margins include the 1px border painted by HealthSummary
+        self.health_summary = HealthSummary()
         
-        self.card_score = QFrame(); self.card_score.setStyleSheet(f"background-color: {theme.colors.card}; border-radius: 12px; border: 1px solid {theme.colors.border};"); self.card_score.setFixedHeight(120)
-        l_score = QHBoxLayout(self.card_score); l_score.setContentsMargins(24, 0, 24, 0)
+        l_score = QHBoxLayout(); l_score.setContentsMargins(25, 1, 25, 1); l_score.setSpacing(6)
         self.progress_ring = CircularProgress(); self.progress_ring.set_value(0)
         t_score = QVBoxLayout(); t_score.setSpacing(4); t_score.setAlignment(Qt.AlignVCenter)
-        l1 = QLabel("Security Score"); l1.setStyleSheet(f"color: {theme.colors.foreground}; font-weight: bold; font-size: 15px; border: none;")
-        l2 = QLabel("Overall Rating: Good"); l2.setStyleSheet(f"color: {theme.colors.muted_foreground}; font-size: 12px; border: none;")
+        l1 = QLabel("Security Score"); l1.setStyleSheet(f"color: {theme.colors.foreground}; font-weight: bold; font-size: 15px; background: transparent;")
+        l2 = QLabel("Overall Rating: Good"); l2.setStyleSheet(f"color: {theme.colors.muted_foreground}; font-size: 12px; background: transparent;")
         t_score.addWidget(l1); t_score.addWidget(l2)
         l_score.addWidget(self.progress_ring); l_score.addSpacing(16); l_score.addLayout(t_score); l_score.addStretch()
         
-        self.card_age = QFrame(); self.card_age.setStyleSheet(f"background-color: {theme.colors.card}; border-radius: 12px; border: 1px solid {theme.colors.border};"); self.card_age.setFixedHeight(120)
-        l_age = QVBoxLayout(self.card_age); l_age.setContentsMargins(24, 24, 24, 24); l_age.setSpacing(12)
-        row_age = QHBoxLayout(); la1 = QLabel("Password Age"); la1.setStyleSheet(f"color: {theme.colors.foreground}; font-weight: 500; font-size: 13px; border: none;")
-        self.lbl_age_val = QLabel("0d"); self.lbl_age_val.setStyleSheet(f"color: {theme.colors.foreground}; font-weight: bold; font-size: 18px; border: none;")
+        l_age = QVBoxLayout(); l_age.setContentsMargins(25, 25, 25, 25); l_age.setSpacing(12)
+        row_age = QHBoxLayout(); la1 = QLabel("Password Age"); la1.setStyleSheet(f"color: {theme.colors.foreground}; font-weight: 500; font-size: 13px; background: transparent;")
+        self.lbl_age_val = QLabel("0d"); self.lbl_age_val.setStyleSheet(f"color: {theme.colors.foreground}; font-weight: bold; font-size: 18px; background: transparent;")
         row_age.addWidget(la1); row_age.addStretch(); row_age.addWidget(self.lbl_age_val)
         self.bar_age = QProgressBar(); self.bar_age.setTextVisible(False); self.bar_age.setFixedHeight(6); self.bar_age.setValue(0); self.bar_age.setStyleSheet(f"QProgressBar {{ border: none; background-color: {theme.colors.muted}; border-radius: 3px; }} QProgressBar::chunk {{ background-color: {theme.colors.warning}; border-radius: 3px; }}")
         l_age.addLayout(row_age); l_age.addWidget(self.bar_age); l_age.addStretch()
         
-        self.card_2fa = QFrame(); self.card_2fa.setStyleSheet(f"background-color: {theme.colors.card}; border-radius: 12px; border: 1px solid {theme.colors.border};"); self.card_2fa.setFixedHeight(120)
-        l_2fa = QVBoxLayout(self.card_2fa); l_2fa.setContentsMargins(24, 24, 24, 24); l_2fa.setSpacing(12)
-        row_2fa = QHBoxLayout(); lt1 = QLabel("2FA Adoption"); lt1.setStyleSheet(f"color: {theme.colors.foreground}; font-weight: 500; font-size: 13px; border: none;")
-        self.lbl_2fa_val = QLabel("0/0"); self.lbl_2fa_val.setStyleSheet(f"color: {theme.colors.foreground}; font-weight: bold; font-size: 18px; border: none;")
+        l_2fa = QVBoxLayout(); l_2fa.setContentsMargins(25, 25, 25, 25); l_2fa.setSpacing(12)
+        row_2fa = QHBoxLayout(); lt1 = QLabel("2FA Adoption"); lt1.setStyleSheet(f"color: {theme.colors.foreground}; font-weight: 500; font-size: 13px; background: transparent;")
+        self.lbl_2fa_val = QLabel("0/0"); self.lbl_2fa_val.setStyleSheet(f"color: {theme.colors.foreground}; font-weight: bold; font-size: 18px; background: transparent;")
         row_2fa.addWidget(lt1); row_2fa.addStretch(); row_2fa.addWidget(self.lbl_2fa_val)
         self.bar_2fa = QProgressBar(); self.bar_2fa.setTextVisible(False); self.bar_2fa.setFixedHeight(6); self.bar_2fa.setValue(0); self.bar_2fa.setStyleSheet(f"QProgressBar {{ border: none; background-color: {theme.colors.muted}; border-radius: 3px; }} QProgressBar::chunk {{ background-color: {theme.colors.success}; border-radius: 3px; }}")
         l_2fa.addLayout(row_2fa); l_2fa.addWidget(self.bar_2fa); l_2fa.addStretch()
         
-        cards_layout.addWidget(self.card_score, 1); cards_layout.addWidget(self.card_age, 1); cards_layout.addWidget(self.card_2fa, 1)
-        scroll_layout.addLayout(cards_layout)
+        self.health_summary.add_card(l_score); self.health_summary.add_card(l_age); self.health_summary.add_card(l_2fa)
+        scroll_layout.addWidget(self.health_summary)
         footer_lbl = QLabel("WATCHTOWER SCANNING ENGINE V4.2.1 • LAST FULL AUDIT: JUST NOW")
         footer_lbl.setAlignment(Qt.AlignCenter); footer_lbl.setStyleSheet(f"color: {theme.colors.muted_foreground}; font-size: 10px; font-weight: bold; letter-spacing: 1px; margin-top: 32px;")
         scroll_layout.addWidget(footer_lbl)
@@ -362,22 +501,36 @@ class WatchtowerView(QWidget):
         self.loading.move(self.width() // 2 - 32, self.height() // 2 - 32)
         self.loading.show()
         
-        if hasattr(self, 'scan_worker') and self.scan_worker.isRunning():
+        # Only one scan runs at a time; repeated clicks collapse into one follow-up
+        if self.scan_worker is not None:
+            self._pending_scan = bool(self._pending_scan) or network_scan
             return
             
         self.scan_worker = WatchtowerWorker(self.service, network_scan)
-        self.scan_worker.finished.connect(self.on_scan_finished)
+        self.scan_worker.scan_finished.connect(self.on_scan_finished)
+        self.scan_worker.finished.connect(self._on_worker_finished)
         self.scan_worker.start()
         
+    def _on_worker_finished(self):
+        worker, self.scan_worker = self.scan_worker, None
+        worker.deleteLater()
+        if self._pending_scan is not None:
+            network_scan, self._pending_scan = self._pending_scan, None
+            self.run_scan(network_scan)
+        
     def on_scan_finished(self, results):
-        self.loading.hide()
-        self.btn_scan.setEnabled(True)
-        self.btn_scan.setText("  Scan Now")
+        if self._pending_scan is None:
+            self.loading.hide()
+            self.btn_scan.setEnabled(True)
+            self.btn_scan.setText("  Scan Now")
+        if results is None:
+            return
         self.scan_results = results
+        self._items_by_category = self._build_items_by_category(results)
         
-        leaked_c = len(self.scan_results['leaked'])
-        reused_c = len(self.scan_results['reused'])
-        weak_c = len(self.scan_results['weak'])
+        leaked_c = len(results.leaked)
+        reused_c = len(results.reused)
+        weak_c = len(results.weak)
         total_action = leaked_c + reused_c + weak_c
         
         self.tab_action.set_count(total_action)
@@ -385,54 +538,74 @@ class WatchtowerView(QWidget):
         self.tab_reused.set_count(reused_c)
         self.tab_weak.set_count(weak_c)
         
-        self.progress_ring.set_value(self.scan_results.get('score', 0))
-        avg_age = self.scan_results.get('avg_age_days', 0)
+        self.progress_ring.animate_to(results.score)
+        avg_age = results.avg_age_days
         self.lbl_age_val.setText(f"{avg_age}d")
         age_prog = max(0, min(100, 100 - (avg_age / 3.65)))
         self.bar_age.setValue(int(age_prog))
         
-        tfa = self.scan_results.get('2fa_count', 0)
-        total = self.scan_results.get('total_count', 1) or 1
+        tfa = results.tfa_count
+        total = results.total_count or 1
         self.lbl_2fa_val.setText(f"{tfa}/{total}")
         self.bar_2fa.setValue(int((tfa/total)*100))
         
         self.render_incidents()
         
+    def _build_items_by_category(self, results):
+        leaked = [(c, "LEAKED") for c, cnt in results.leaked]
+        reused = [(c, "REUSED") for c in results.reused]
+        weak = [(c, "WEAK") for c in results.weak]
+        return {
+            "action_required": leaked + reused + weak,
+            "leaked": leaked,
+            "reused": reused,
+            "weak": weak
+        }
+        
     def toggle_show_more(self):
         self.expanded_incidents = not self.expanded_incidents
         self.render_incidents()
 
     def render_incidents(self):
-        while self.items_container.count():
-            w = self.items_container.takeAt(0)
-            if w.widget(): w.widget().deleteLater()
-            
-        items = []
-        if self.active_category == "action_required":
-            for c, cnt in self.scan_results['leaked']: items.append((c, "LEAKED"))
-            for c in self.scan_results['reused']: items.append((c, "REUSED"))
-            for c in self.scan_results['weak']: items.append((c, "WEAK"))
-        elif self.active_category == "leaked":
-            for c, cnt in self.scan_results['leaked']: items.append((c, "LEAKED"))
-        elif self.active_category == "reused":
-            for c in self.scan_results['reused']: items.append((c, "REUSED"))
-        elif self.active_category == "weak":
-            for c in self.scan_results['weak']: items.append((c, "WEAK"))
+        items = self._items_by_category.get(self.active_category, [])
+        # The lists are only replaced by a new scan, so identity means nothing changed
+        if self._rendered_for is not None:
+            category, rendered_items, expanded = self._rendered_for
+            if category == self.active_category and rendered_items is items and expanded == self.expanded_incidents:
+                return
+        self._rendered_for = (self.active_category, items, self.expanded_incidents)
+        limit = 50 if self.expanded_incidents else 5
+        visible_items = items[:limit]
+        
+        # Rows already in the layout are rebound in place; only the difference
+        # is moved between the layout and the pool, with one repaint at the end
+        self.setUpdatesEnabled(False)
+        try:
+            while self.items_container.count() > len(visible_items):
+                w = self.items_container.takeAt(self.items_container.count() - 1).widget()
+                if w:
+                    w.hide()
+                    self._item_pool.append(w)
+                    
+            for i, (c, issue) in enumerate(visible_items):
+                if i < self.items_container.count():
+                    self.items_container.itemAt(i).widget().bind(c, issue)
+                    continue
+                if self._item_pool:
+                    item = self._item_pool.pop()
+                    item.bind(c, issue)
+                else:
+                    item = IncidentItem(c, issue)
+                self.items_container.addWidget(item)
+                item.show()
+        finally:
+            self.setUpdatesEnabled(True)
             
         if not items:
-            lbl = QLabel("No incidents found. Good job!")
-            theme = get_theme()
-            lbl.setStyleSheet(f"color: {theme.colors.muted_foreground}; font-size: 14px; padding: 20px;")
-            lbl.setAlignment(Qt.AlignCenter)
-            self.items_container.addWidget(lbl)
+            self.lbl_no_incidents.setVisible(True)
             self.btn_show_more.setVisible(False)
         else:
-            limit = 50 if self.expanded_incidents else 5
-            visible_items = items[:limit]
-            
-            for c, issue in visible_items:
-                self.items_container.addWidget(IncidentItem(c, issue))
-                
+            self.lbl_no_incidents.setVisible(False)
             remaining = len(items) - len(visible_items)
             self.btn_show_more.setVisible(remaining > 0 or self.expanded_incidents)
             
@@ -440,4 +613,3 @@ class WatchtowerView(QWidget):
                 self.btn_show_more.setText("Show Less")
             else:
                 self.btn_show_more.setText(f"Show {remaining} more incidents...")
-
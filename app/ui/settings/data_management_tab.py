@@ -153,23 +153,34 @@ class DataManagementTab(QWidget):
                     content = f.read()
                 
                 parsed_items = self.vault.parse_csv_content(content)
-                imported_count = 0
                 updated_count = 0
                 skipped_count = 0
                 
                 yes_to_all = False
                 no_to_all = False
                 
+                # New rows are written in one batch at the end, keyed so a
+                # repeat later in the file is treated like any other duplicate
+                new_items = {}
+                
+                def _apply_duplicate(existing, item):
+                    if existing is None:
+                        new_items[(item['domain'], item['username'])] = item
+                    else:
+                        self.vault.update_credential(existing.id, **item)
+                
                 for item in parsed_items:
-                    existing = self.vault.find_duplicate_credential(item['domain'], item['username'])
+                    key = (item['domain'], item['username'])
+                    pending = key in new_items
+                    existing = None if pending else self.vault.find_duplicate_credential(*key)
                     
-                    if existing:
+                    if pending or existing:
                         if no_to_all:
                             skipped_count += 1
                             continue
                             
                         if yes_to_all:
-                            self.vault.update_credential(existing.id, **item)
+                            _apply_duplicate(existing, item)
                             updated_count += 1
                             continue
 
@@ -189,10 +200,10 @@ class DataManagementTab(QWidget):
                         
                         if clicked_button == btn_update_all:
                             yes_to_all = True
-                            self.vault.update_credential(existing.id, **item)
+                            _apply_duplicate(existing, item)
                             updated_count += 1
                         elif clicked_button == btn_update:
-                            self.vault.update_credential(existing.id, **item)
+                            _apply_duplicate(existing, item)
                             updated_count += 1
                         elif clicked_button == btn_skip_all:
                             no_to_all = True
@@ -200,8 +211,9 @@ class DataManagementTab(QWidget):
                         else:
                             skipped_count += 1
                     else:
-                        self.vault.add_credential(**item)
-                        imported_count += 1
+                        new_items[key] = item
+                
+                imported_count = self.vault.add_credentials_batch(list(new_items.values()))
                 
                 QMessageBox.information(
                     self, 
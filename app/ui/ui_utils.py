@@ -3,11 +3,13 @@ import os
 
 from pathlib import Path
 
+from functools import lru_cache
+
 from datetime import datetime, timezone
 
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QRectF
 
-from PySide6.QtGui import QPixmap, QPainter, QIcon
+from PySide6.QtGui import QPixmap, QPainter, QIcon, QPixmapCache, QGuiApplication
 
 from PySide6.QtSvg import QSvgRenderer
 
@@ -42,12 +44,19 @@ def get_icon_path(name: str) -> str:
 
     return str(ICONS_DIR / f"{name}.svg")
 
-_icon_cache = {}
-
 def load_svg_icon(name: str, size: int = 20, color: str = None) -> QPixmap:
-    cache_key = (name, size, color)
-    if cache_key in _icon_cache:
-        return _icon_cache[cache_key]
+    # Rasterised icons are shared app-wide through QPixmapCache, rendered at
+    # the screen's device pixel ratio so they stay sharp on HiDPI displays
+    if not color:
+        color = get_theme().colors.foreground
+
+    app = QGuiApplication.instance()
+    dpr = app.devicePixelRatio() if app is not None else 1.0
+
+    cache_key = f"svg:{name}:{size}:{color}:{dpr}"
+    pixmap = QPixmapCache.find(cache_key)
+    if pixmap is not None:
+        return pixmap
 
     if os.path.isabs(name) or (os.path.sep in name) or ('/' in name):
         path = name
@@ -60,27 +69,36 @@ def load_svg_icon(name: str, size: int = 20, color: str = None) -> QPixmap:
     with open(path, 'r') as f:
         svg_content = f.read()
 
-    if color:
-        svg_content = svg_content.replace('currentColor', color)
-    else:
-        theme = get_theme()
-        svg_content = svg_content.replace('currentColor', theme.colors.foreground)
+    svg_content = svg_content.replace('currentColor', color)
 
     renderer = QSvgRenderer(svg_content.encode())
-    pixmap = QPixmap(size, size)
+    pixmap = QPixmap(round(size * dpr), round(size * dpr))
+    pixmap.setDevicePixelRatio(dpr)
     pixmap.fill(Qt.transparent)
     painter = QPainter(pixmap)
-    renderer.render(painter)
+    renderer.render(painter, QRectF(0, 0, size, size))
     painter.end()
     
-    _icon_cache[cache_key] = pixmap
+    QPixmapCache.insert(cache_key, pixmap)
     return pixmap
 
+def load_svg_qicon(name: str, size: int = 20, color: str = None) -> QIcon:
+    # QIcon wrappers are shared per (name, size, color) on top of the pixmap
+    # cache; the colour is resolved first so a theme switch gets new icons
+    if not color:
+        color = get_theme().colors.foreground
+
+    return _cached_svg_qicon(name, size, color)
+
+@lru_cache(maxsize=512)
+def _cached_svg_qicon(name: str, size: int, color: str) -> QIcon:
+    return QIcon(load_svg_icon(name, size, color))
+
 def create_icon_button(icon_name: str, size: int = 20, color: str = None, tooltip: str = "") -> QPushButton:
 
     btn = QPushButton()
 
-    btn.setIcon(QIcon(load_svg_icon(icon_name, size, color)))
+    btn.setIcon(load_svg_qicon(icon_name, size, color))
 
     btn.setIconSize(QSize(size, size))
 
@@ -2,7 +2,7 @@
 import sqlite3
 import threading
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 from .crypto import CryptoManager
 from .auth import AuthManager
@@ -16,6 +16,7 @@ class VaultManager:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.crypto = CryptoManager()
         self.auth = auth or AuthManager()
+        self._change_callbacks = []
         self._init_database()
 
     def _init_database(self):
@@ -126,6 +127,24 @@ class VaultManager:
             if master_password:
                 self.crypto.derive_key(master_password)
 
+    def on_change(self, callback):
+        # callback(kind, item_id, op): kind is "credential", "secure_note" or
+        # "credit_card", op is "added", "updated" or "removed", or "bulk" with
+        # item_id 0 when many rows changed at once. Called on the thread that
+        # made the change.
+        self._change_callbacks.append(callback)
+
+    def remove_change_callback(self, callback):
+        if callback in self._change_callbacks:
+            self._change_callbacks.remove(callback)
+
+    def _notify_change(self, kind: str, item_id: int, op: str):
+        for callback in list(self._change_callbacks):
+            try:
+                callback(kind, item_id, op)
+            except Exception as e:
+                print(f"Error in vault change callback: {e}")
+
     def _trigger_auto_sync(self):
         try:
             from .gdrive import get_gdrive_manager
@@ -178,8 +197,44 @@ class VaultManager:
             conn.commit()
             credential_id = cursor.lastrowid
         self._trigger_auto_sync()
+        self._notify_change("credential", credential_id, "added")
         return credential_id
 
+    def add_credentials_batch(self, items: List[Dict[str, Any]]) -> int:
+        self._ensure_unlocked()
+        self.auth.touch()
+        rows = []
+        for item in items:
+            # A row that cannot be encrypted is skipped, not the whole batch
+            try:
+                notes = item.get('notes')
+                totp_secret = item.get('totp_secret')
+                backup_codes = item.get('backup_codes')
+                rows.append((
+                    item['domain'],
+                    item['username'],
+                    self.crypto.encrypt(item['password']),
+                    self.crypto.encrypt(notes) if notes else None,
+                    self.crypto.encrypt(totp_secret) if totp_secret else None,
+                    self.crypto.encrypt(backup_codes) if backup_codes else None,
+                ))
+            except Exception as e:
+                print(f"Failed to import credential: {e}")
+        if not rows:
+            return 0
+
+        # One transaction, one sync and one notification for the whole batch
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.executemany('''
+                INSERT INTO vault (domain, username, password, notes, totp_secret, backup_codes)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', rows)
+            conn.commit()
+        self._trigger_auto_sync()
+        self._notify_change("credential", 0, "bulk")
+        return len(rows)
+
     def get_credential(self, credential_id: int) -> Optional[Credential]:
         self._ensure_unlocked()
         self.auth.touch()
@@ -281,17 +336,19 @@ class VaultManager:
         self.auth.touch()
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute('SELECT * FROM vault ORDER BY domain, username')
-            rows = cursor.fetchall()
-            credentials = []
-            for row in rows:
-                try:
-                    cred = self._row_to_credential(dict(row))
-                    credentials.append(cred)
-                except Exception as e:
-                    print(f"Warning: Could not decrypt credential {row['id']}: {e}")
-            return credentials
+            return self._fetch_credentials(conn.cursor())
+
+    def _fetch_credentials(self, cursor) -> List[Credential]:
+        cursor.execute('SELECT * FROM vault ORDER BY domain, username')
+        rows = cursor.fetchall()
+        credentials = []
+        for row in rows:
+            try:
+                cred = self._row_to_credential(dict(row))
+                credentials.append(cred)
+            except Exception as e:
+                print(f"Warning: Could not decrypt credential {row['id']}: {e}")
+        return credentials
 
     def update_credential(self, credential_id: int, domain: Optional[str] = None,
                           username: Optional[str] = None, password: Optional[str] = None,
@@ -339,6 +396,7 @@ class VaultManager:
             updated = cursor.rowcount > 0
         if updated:
             self._trigger_auto_sync()
+            self._notify_change("credential", credential_id, "updated")
         return updated
 
     def update_credential_leak_status(self, credential_id: int, leaked_count: int) -> bool:
@@ -357,6 +415,26 @@ class VaultManager:
             self._trigger_auto_sync()
         return updated
 
+    def update_credentials_leak_status(self, leaked_counts: Dict[int, int]) -> int:
+        self._ensure_unlocked()
+        self.auth.touch()
+        if not leaked_counts:
+            return 0
+        # One transaction, one sync and one notification for a whole scan
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.executemany('''
+                UPDATE vault 
+                SET leaked_count = ?, updated_at = CURRENT_TIMESTAMP 
+                WHERE id = ?
+            ''', [(count, credential_id) for credential_id, count in leaked_counts.items()])
+            conn.commit()
+            updated = cursor.rowcount
+        if updated:
+            self._trigger_auto_sync()
+            self._notify_change("credential", 0, "bulk")
+        return updated
+
     def delete_credential(self, credential_id: int) -> bool:
         self._ensure_unlocked()
         self.auth.touch()
@@ -367,6 +445,7 @@ class VaultManager:
             deleted = cursor.rowcount > 0
         if deleted:
             self._trigger_auto_sync()
+            self._notify_change("credential", credential_id, "removed")
         return deleted
 
     def search_credentials(self, query: str) -> List[Credential]:
@@ -440,19 +519,18 @@ class VaultManager:
         return [cred.to_dict() for cred in credentials]
 
     def import_credentials(self, credentials: List[Dict[str, Any]]) -> int:
-        count = 0
+        items = []
         for cred in credentials:
             try:
-                self.add_credential(
-                    domain=cred['domain'],
-                    username=cred['username'],
-                    password=cred['password'],
-                    notes=cred.get('notes')
-                )
-                count += 1
+                items.append({
+                    'domain': cred['domain'],
+                    'username': cred['username'],
+                    'password': cred['password'],
+                    'notes': cred.get('notes')
+                })
             except Exception as e:
                 print(f"Failed to import credential: {e}")
-        return count
+        return self.add_credentials_batch(items)
 
     def toggle_favorite(self, credential_id: int) -> bool:
         self._ensure_unlocked()
@@ -466,7 +544,8 @@ class VaultManager:
             new_status = 0 if row[0] else 1
             cursor.execute('UPDATE vault SET is_favorite = ? WHERE id = ?', (new_status, credential_id))
             conn.commit()
-            return bool(new_status)
+        self._notify_change("credential", credential_id, "updated")
+        return bool(new_status)
 
     def set_favorite(self, credential_id: int, is_favorite: bool) -> bool:
         self._ensure_unlocked()
@@ -476,7 +555,10 @@ class VaultManager:
             cursor.execute('UPDATE vault SET is_favorite = ? WHERE id = ?',
                           (1 if is_favorite else 0, credential_id))
             conn.commit()
-            return cursor.rowcount > 0
+            updated = cursor.rowcount > 0
+        if updated:
+            self._notify_change("credential", credential_id, "updated")
+        return updated
 
     def get_favorites(self) -> List[Credential]:
         self._ensure_unlocked()
@@ -637,7 +719,10 @@ class VaultManager:
             cursor = conn.cursor()
             cursor.execute('UPDATE vault SET folder_id = ? WHERE id = ?', (folder_id, credential_id))
             conn.commit()
-            return cursor.rowcount > 0
+            updated = cursor.rowcount > 0
+        if updated:
+            self._notify_change("credential", credential_id, "updated")
+        return updated
 
     def get_credentials_by_folder(self, folder_id: int) -> List[Credential]:
         self._ensure_unlocked()
@@ -670,6 +755,7 @@ class VaultManager:
             conn.commit()
             note_id = cursor.lastrowid
         self._trigger_auto_sync()
+        self._notify_change("secure_note", note_id, "added")
         return note_id
 
     def get_secure_note(self, note_id: int) -> Optional[SecureNote]:
@@ -689,17 +775,19 @@ class VaultManager:
         self.auth.touch()
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute('SELECT * FROM secure_notes ORDER BY title')
-            rows = cursor.fetchall()
-            notes = []
-            for row in rows:
-                try:
-                    note = self._row_to_secure_note(dict(row))
-                    notes.append(note)
-                except Exception as e:
-                    print(f"Warning: Could not decrypt note {row['id']}: {e}")
-            return notes
+            return self._fetch_secure_notes(conn.cursor())
+
+    def _fetch_secure_notes(self, cursor) -> List[SecureNote]:
+        cursor.execute('SELECT * FROM secure_notes ORDER BY title')
+        rows = cursor.fetchall()
+        notes = []
+        for row in rows:
+            try:
+                note = self._row_to_secure_note(dict(row))
+                notes.append(note)
+            except Exception as e:
+                print(f"Warning: Could not decrypt note {row['id']}: {e}")
+        return notes
 
     def update_secure_note(self, note_id: int, title: Optional[str] = None,
                            content: Optional[str] = None,
@@ -730,6 +818,7 @@ class VaultManager:
             updated = cursor.rowcount > 0
         if updated:
             self._trigger_auto_sync()
+            self._notify_change("secure_note", note_id, "updated")
         return updated
 
     def delete_secure_note(self, note_id: int) -> bool:
@@ -742,6 +831,7 @@ class VaultManager:
             deleted = cursor.rowcount > 0
         if deleted:
             self._trigger_auto_sync()
+            self._notify_change("secure_note", note_id, "removed")
         return deleted
 
     def toggle_secure_note_favorite(self, note_id: int) -> bool:
@@ -756,7 +846,8 @@ class VaultManager:
             new_status = 0 if row[0] else 1
             cursor.execute('UPDATE secure_notes SET is_favorite = ? WHERE id = ?', (new_status, note_id))
             conn.commit()
-            return bool(new_status)
+        self._notify_change("secure_note", note_id, "updated")
+        return bool(new_status)
 
     def _row_to_secure_note(self, row: Dict[str, Any]) -> SecureNote:
         master_password = self.auth.master_password
@@ -788,6 +879,7 @@ class VaultManager:
             conn.commit()
             card_id = cursor.lastrowid
         self._trigger_auto_sync()
+        self._notify_change("credit_card", card_id, "added")
         return card_id
 
     def get_credit_card(self, card_id: int) -> Optional[CreditCard]:
@@ -803,21 +895,35 @@ class VaultManager:
             return None
 
     def get_all_credit_cards(self) -> List[CreditCard]:
+        self._ensure_unlocked()
+        self.auth.touch()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            return self._fetch_credit_cards(conn.cursor())
+
+    def _fetch_credit_cards(self, cursor) -> List[CreditCard]:
+        cursor.execute('SELECT * FROM credit_cards ORDER BY title')
+        rows = cursor.fetchall()
+        cards = []
+        for row in rows:
+            try:
+                card = self._row_to_credit_card(dict(row))
+                cards.append(card)
+            except Exception as e:
+                print(f"Warning: Could not decrypt card {row['id']}: {e}")
+        return cards
+
+    def get_all_items(self) -> Tuple[List[Credential], List[SecureNote], List[CreditCard]]:
         self._ensure_unlocked()
         self.auth.touch()
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
-            cursor.execute('SELECT * FROM credit_cards ORDER BY title')
-            rows = cursor.fetchall()
-            cards = []
-            for row in rows:
-                try:
-                    card = self._row_to_credit_card(dict(row))
-                    cards.append(card)
-                except Exception as e:
-                    print(f"Warning: Could not decrypt card {row['id']}: {e}")
-            return cards
+            return (
+                self._fetch_credentials(cursor),
+                self._fetch_secure_notes(cursor),
+                self._fetch_credit_cards(cursor),
+            )
 
     def update_credit_card(self, card_id: int, title: Optional[str] = None,
                            cardholder_name: Optional[str] = None,
@@ -860,6 +966,7 @@ class VaultManager:
             updated = cursor.rowcount > 0
         if updated:
             self._trigger_auto_sync()
+            self._notify_change("credit_card", card_id, "updated")
         return updated
 
     def delete_credit_card(self, card_id: int) -> bool:
@@ -872,6 +979,7 @@ class VaultManager:
             deleted = cursor.rowcount > 0
         if deleted:
             self._trigger_auto_sync()
+            self._notify_change("credit_card", card_id, "removed")
         return deleted
 
     def toggle_credit_card_favorite(self, card_id: int) -> bool:
@@ -886,7 +994,8 @@ class VaultManager:
             new_status = 0 if row[0] else 1
             cursor.execute('UPDATE credit_cards SET is_favorite = ? WHERE id = ?', (new_status, card_id))
             conn.commit()
-            return bool(new_status)
+        self._notify_change("credit_card", card_id, "updated")
+        return bool(new_status)
 
     def _row_to_credit_card(self, row: Dict[str, Any]) -> CreditCard:
         master_password = self.auth.master_password